@@ -0,0 +1 @@
+Add `plone.api.content.copy_tree` to copy large trees of content in batches with commits in between, optionally in a background thread, with a pollable status and support for resuming.
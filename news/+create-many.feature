@@ -0,0 +1 @@
+Add `plone.api.content.create_many` to create many content items in one container without a temporary id, rename and savepoint per item.
@@ -0,0 +1 @@
+Add `plone.api.portal.get_current_languages` to resolve the language of many contexts at once, and read the default language without building a records proxy, cached with the registry records by `plone.api.portal.enable_lookup_cache`.
@@ -0,0 +1 @@
+Delete many objects passed to `plone.api.content.delete` with one `manage_delObjects` call per container, in batches with savepoints and progress logging.
@@ -0,0 +1 @@
+Add the `fields`, `as_rows` and `as_columns` parameters to `plone.api.content.find` to return plain metadata rows instead of catalog brains.
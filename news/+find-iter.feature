@@ -0,0 +1 @@
+Add `plone.api.content.find_iter` to iterate over found objects in chunks while keeping the ZODB cache small.
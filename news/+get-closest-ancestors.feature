@@ -0,0 +1 @@
+Add `plone.api.content.get_closest_ancestors` to look up the closest ancestor providing an interface for many items with one catalog query.
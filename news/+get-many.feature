@@ -0,0 +1 @@
+Add `plone.api.content.get_many` to get many objects by UID or path with a single catalog query.
@@ -0,0 +1 @@
+Cache the site path and traversed containers of `plone.api.content.get` per request while the lookup cache is enabled, and add a `paths` parameter to get many objects traversing shared parents once.
@@ -0,0 +1 @@
+Add `plone.api.content.get_states` to get the workflow states of many items from the catalog without loading the objects.
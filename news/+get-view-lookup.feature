@@ -0,0 +1 @@
+Only list the available views in the error of `plone.api.content.get_view` when the message is formatted, and look up the view factory from the memoised adapter registry lookup.
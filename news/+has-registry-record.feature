@@ -0,0 +1 @@
+Add `plone.api.portal.has_registry_record`, and only look up the suggested records of a missing record in `get_registry_record` when the error message is formatted, from a trigram index of the record names while the lookup cache is enabled.
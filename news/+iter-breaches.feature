@@ -0,0 +1 @@
+Add `plone.api.relation.iter_breaches` to find relations that would break when deleting content, using the relation catalog. `plone.api.content.delete` uses it to check link integrity.
@@ -0,0 +1 @@
+Walk the parents lazily in `plone.api.content.iter_ancestors`, so `get_closest_ancestor` stops at the first match, and share the chains of parents within a request while the lookup cache is enabled.
@@ -0,0 +1 @@
+Add `plone.api.portal.get_localized_times` to localize many dates at once, and compile the date formats of `plone.api.portal.get_localized_time` once per language and format.
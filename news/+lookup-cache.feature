@@ -0,0 +1 @@
+Add `plone.api.portal.enable_lookup_cache` and `plone.api.portal.get_lookup_cache_stats` for an opt-in, per-thread cache of the portal object and its tools.
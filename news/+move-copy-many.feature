@@ -0,0 +1 @@
+Add `plone.api.content.move_many` and `plone.api.content.copy_many` to move or copy many objects with one cut or copy per container and a single paste.
@@ -0,0 +1 @@
+Add `plone.api.portal.get_registry_records` to read many registry records at once, and cache the records read within a transaction while the lookup cache is enabled.
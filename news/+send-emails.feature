@@ -0,0 +1 @@
+Add `plone.api.portal.send_emails` to send many e-mails at commit time over few SMTP connections, or to a maildir spool.
@@ -0,0 +1 @@
+Add `plone.api.portal.set_registry_records` to validate and set many registry records at once.
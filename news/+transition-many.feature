@@ -0,0 +1 @@
+Add `plone.api.content.transition_many` to transition many objects with one route lookup per workflow state and per-object error reporting.
@@ -0,0 +1 @@
+Add `plone.api.portal.translate_many`, and cache translations into a given language in `plone.api.portal.translate` while the lookup cache is enabled.
@@ -0,0 +1 @@
+Add `plone.api.portal.enable_vocabulary_cache` to keep vocabularies for some seconds, and cache the sorted list of `plone.api.portal.get_vocabulary_names` until vocabulary factories are registered or unregistered.
@@ -1,13 +1,34 @@
 """Module that provides functionality for content manipulation."""
 
-from Acquisition import aq_chain
+from AccessControl import getSecurityManager
+from AccessControl import Unauthorized
+from Acquisition import aq_base
+from Acquisition import aq_inContextOf
 from Acquisition import aq_inner
+from Acquisition import aq_parent
+from collections import deque
+from collections import namedtuple
 from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Iterator
-from copy import copy as _copy
-from itertools import islice
+from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
+from logging import getLogger
+from OFS.CopySupport import _cb_decode
+from OFS.CopySupport import _cb_encode
+from OFS.CopySupport import CopyError
+from OFS.event import ObjectClonedEvent
+from OFS.subscribers import compatibilityCall
+from operator import attrgetter
+from operator import methodcaller
+from plone.api import env
 from plone.api import portal
+from plone.api import relation
+from plone.api.exc import _LazyInvalidParameterError
 from plone.api.exc import InvalidParameterError
+from plone.api.exc import MissingParameterError
+from plone.api.exc import PloneApiError
 from plone.api.types import Container
 from plone.api.types import Content
 from plone.api.types import Request
@@ -16,32 +37,55 @@ from plone.api.validation import mutually_exclusive_parameters
 from plone.api.validation import required_parameters
 from plone.app.linkintegrity.exceptions import LinkIntegrityNotificationException
 from plone.app.uuid.utils import uuidToObject
+from plone.folder.default import DefaultOrdering
 from plone.uuid.interfaces import IUUID
+from Products.BTreeFolder2.BTreeFolder2 import BTreeFolder2Base
 from Products.CMFCore.DynamicType import DynamicType
+from Products.CMFCore.indexing import processQueue
 from Products.CMFCore.WorkflowCore import WorkflowException
 from Products.CMFPlone.WorkflowTool import WorkflowTool
 from Products.DCWorkflow.DCWorkflow import DCWorkflowDefinition
+from Products.ZCatalog.interfaces import ICatalogBrain
+from Testing.makerequest import makerequest
 from typing import Any
-from zope.component import ComponentLookupError
-from zope.component import getMultiAdapter
+from zExceptions import NotFound
+from ZODB.blob import Blob
+from ZODB.DB import DB
+from ZODB.POSException import ConflictError
+from zodbpickle.pickle import Pickler
+from zodbpickle.pickle import Unpickler
+from zope.annotation.interfaces import IAnnotations
 from zope.component import getSiteManager
+from zope.component.hooks import setSite
 from zope.container.interfaces import INameChooser
+from zope.event import notify
 from zope.globalrequest import getRequest
+from zope.globalrequest import setRequest
 from zope.interface import Interface
 from zope.interface import providedBy
 from zope.interface.interface import InterfaceClass
+from zope.lifecycleevent import ObjectCopiedEvent
+from zope.lifecycleevent.interfaces import IObjectMovedEvent
 from ZPublisher.BaseRequest import RequestContainer
 from ZTUtils.Lazy import LazyCat
 from ZTUtils.Lazy import LazyMap
 
+import shutil
+import tempfile
+import threading
 import transaction
 import uuid
 
+logger = getLogger("plone.api.content")
+
 _marker = object()
 
 # Maximum number of attempts to generate a unique random ID
 MAX_UNIQUE_ID_ATTEMPTS = 100
 
+# Maximum number of attempts of a background copy_tree on conflicts
+MAX_COPY_TREE_ATTEMPTS = 3
+
 
 @required_parameters("container", "type")
 @at_least_one_of("id", "title")
@@ -98,6 +142,31 @@ def create(
     if title:
         kwargs["title"] = title
 
+    content = _invoke_factory(container, type, content_id, **kwargs)
+    if not id or (safe_id and id):
+        # Create a new id from title
+        chooser = INameChooser(container)
+        derived_id = id or title
+        new_id = chooser.chooseName(derived_id, content)
+        # kacee: we must do a partial commit, else the renaming fails because
+        # the object isn't in the zodb.
+        # Thus if it is not in zodb, there's nothing to move. We should
+        # choose a correct id when
+        # the object is created.
+        # maurits: tests run fine without this though.
+        transaction.savepoint(optimistic=True)
+        content.aq_parent.manage_renameObject(content_id, new_id)
+
+    return content
+
+
+def _invoke_factory(
+    container: Container,
+    type: str,
+    content_id: str,
+    **kwargs,
+) -> Content:
+    """Add a new object with the given id to the container and return it."""
     try:
         container.invokeFactory(type, content_id, **kwargs)
     except UnicodeDecodeError:
@@ -120,27 +189,193 @@ def create(
             ),
         )
 
-    content: Content = container[content_id]
-    if not id or (safe_id and id):
-        # Create a new id from title
-        chooser = INameChooser(container)
-        derived_id = id or title
-        new_id = chooser.chooseName(derived_id, content)
-        # kacee: we must do a partial commit, else the renaming fails because
-        # the object isn't in the zodb.
-        # Thus if it is not in zodb, there's nothing to move. We should
-        # choose a correct id when
-        # the object is created.
-        # maurits: tests run fine without this though.
-        transaction.savepoint(optimistic=True)
-        content.aq_parent.manage_renameObject(content_id, new_id)
+    return container[content_id]
 
-    return content
 
+@required_parameters("container", "items")
+def create_many(
+    container: Container,
+    items: Iterable[dict[str, Any]],
+    safe_id: bool = False,
+    batch_size: int = 100,
+) -> Iterator[Content]:
+    """Create many content items in the same container.
 
-@mutually_exclusive_parameters("path", "UID")
-@at_least_one_of("path", "UID")
-def get(path: str | None = None, UID: str | None = None) -> Content | None:
+    Unlike :func:`~plone.api.content.create`, the final id of every item is
+    chosen before the item is added, so no temporary id, rename or savepoint
+    is needed per item. A single savepoint is made after every ``batch_size``
+    created items instead.
+
+    :param container: [required] Container object in which to create the new
+        objects.
+    :type container: Folderish content object
+    :param items: [required] Iterable of mappings describing the items to
+        create. Each mapping needs a ``type`` and at least one of ``id`` or
+        ``title``. All other keys are passed on as field values, like the
+        keyword arguments of :func:`~plone.api.content.create`.
+    :type items: iterable of dicts
+    :param safe_id: When False, a given id will be enforced. If the id is
+        conflicting with another object in the container, an error is raised.
+        When True, choose a new, non-conflicting id.
+    :type safe_id: boolean
+    :param batch_size: Number of items to create between two savepoints.
+    :type batch_size: integer
+    :returns: Iterator over the created content objects, in the order of
+        ``items``
+    :raises:
+        :class:`~plone.api.exc.MissingParameterError`,
+        :class:`~plone.api.exc.InvalidParameterError`
+    :Example: :ref:`content-create-many-example`
+    """
+    if batch_size < 1:
+        raise InvalidParameterError("The 'batch_size' parameter must be positive.")
+
+    chooser = None
+    for index, item in enumerate(items, 1):
+        kwargs = dict(item)
+        type = kwargs.pop("type", None)
+        id = kwargs.pop("id", None)
+        title = kwargs.pop("title", None)
+        if not type:
+            raise MissingParameterError(
+                f"Missing required parameter(s): type (item {index})"
+            )
+        if not id and not title:
+            raise MissingParameterError(
+                "At least one of these parameters must be supplied: "
+                f"id, title (item {index})."
+            )
+
+        if id and not safe_id:
+            content_id = id
+        else:
+            # The name chooser only uses the object to find the request and
+            # the portal tools, so the container can stand in for the item
+            # that does not exist yet.
+            if chooser is None:
+                chooser = INameChooser(container)
+            content_id = chooser.chooseName(id or title, container)
+
+        if title:
+            kwargs["title"] = title
+
+        yield _invoke_factory(container, type, content_id, **kwargs)
+
+        if index % batch_size == 0:
+            transaction.savepoint(optimistic=True)
+
+
+# Per thread: (site, request, transaction, site path, parents by path) of the
+# last path lookup, kept while the lookup cache of plone.api.portal is enabled.
+_path_cache = threading.local()
+
+
+def _path_lookup(site: Container) -> tuple[str, dict[str, Container]]:
+    """Return the site path and the parent objects already traversed."""
+    request = getRequest()
+    txn = transaction.get()
+    if portal.LOOKUP_CACHE_ENABLED:
+        entry = getattr(_path_cache, "entry", None)
+        if (
+            entry is not None
+            and entry[0] is site
+            and entry[1] is request
+            and entry[2] is txn
+        ):
+            return entry[3], entry[4]
+    site_path = "/".join(site.getPhysicalPath())
+    parents: dict[str, Container] = {}
+    _path_cache.entry = (
+        (site, request, txn, site_path, parents)
+        if portal.LOOKUP_CACHE_ENABLED
+        else None
+    )
+    return site_path, parents
+
+
+def _invalidate_path_cache(event: IObjectMovedEvent):
+    """Forget the traversed parents when an object is moved or removed."""
+    _path_cache.entry = None
+
+
+def _traverse_to_parent(
+    site: Container,
+    site_path: str,
+    path: str,
+    parents: dict[str, Container],
+) -> Container:
+    """Traverse to the object at path without restrictions.
+
+    Each object on the way is stored in ``parents``, so paths sharing a
+    prefix only traverse that prefix once.
+    """
+    parent = parents.get(path)
+    if parent is None:
+        if path == site_path:
+            parent = site
+        elif path.startswith(f"{site_path}/"):
+            parent_path, name = path.rpartition("/")[::2]
+            parent = _traverse_to_parent(site, site_path, parent_path, parents)
+            parent = parent.unrestrictedTraverse(name)
+        else:
+            parent = site.unrestrictedTraverse(path)
+        parents[path] = parent
+    return parent
+
+
+def _traverse_to_content(
+    site: Container,
+    site_path: str,
+    path: str,
+    parents: dict[str, Container],
+    unrestricted: bool = False,
+) -> Content | None:
+    """Traverse to the content at the absolute path.
+
+    The parent is traversed without restrictions, the item itself with
+    restrictions unless ``unrestricted`` is set.
+    """
+    parent_path, name = path.rpartition("/")[::2]
+    parent = _traverse_to_parent(site, site_path, parent_path, parents)
+    if unrestricted:
+        content = parent.unrestrictedTraverse(name)
+    else:
+        content = parent.restrictedTraverse(name)
+    # Only return a content if it implements DynamicType,
+    # which is true for Dexterity content and Comment (plone.app.discussion)
+    return content if isinstance(content, DynamicType) else None
+
+
+def _traverse_paths(
+    paths: Iterable[str | None],
+    unrestricted: bool = False,
+    absolute: bool = False,
+) -> list[Content | None]:
+    """Traverse to the content at each path, with None for misses."""
+    site = portal.get()
+    site_path, parents = _path_lookup(site)
+    results: list[Content | None] = []
+    for path in paths:
+        if not path:
+            results.append(None)
+            continue
+        if not absolute and not path.startswith(site_path):
+            path = f"{site_path}{path}"
+        try:
+            content = _traverse_to_content(site, site_path, path, parents, unrestricted)
+        except (KeyError, AttributeError, NotFound, Unauthorized):
+            content = None
+        results.append(content)
+    return results
+
+
+@mutually_exclusive_parameters("path", "UID", "paths")
+@at_least_one_of("path", "UID", "paths")
+def get(
+    path: str | None = None,
+    UID: str | None = None,
+    paths: Iterable[str] | None = None,
+) -> Content | list[Content | None] | None:
     """Get an object.
 
     :param path: Path to the object we want to get, relative to
@@ -148,38 +383,76 @@ def get(path: str | None = None, UID: str | None = None) -> Content | None:
     :type path: string
     :param UID: UID of the object we want to get.
     :type UID: string
-    :returns: Content object
+    :param paths: Paths to many objects we want to get, relative to the
+        portal root. Parents shared by several paths are traversed once.
+    :type paths: iterable of strings
+    :returns: Content object, or a list of content objects in the order of
+        ``paths`` with ``None`` for objects that cannot be found or accessed.
     :raises:
         ValueError,
     :Example: :ref:`content-get-example`
     """
+    if paths is not None:
+        return _traverse_paths(paths)
+
     if path:
         site = portal.get()
-        site_absolute_path = "/".join(site.getPhysicalPath())
-        if not path.startswith(f"{site_absolute_path}"):
+        site_path, parents = _path_lookup(site)
+        if not path.startswith(f"{site_path}"):
             path = "{site_path}{relative_path}".format(
-                site_path=site_absolute_path,
+                site_path=site_path,
                 relative_path=path,
             )
         try:
-            path_list = path.split("/")
-            if len(path_list) > 1:
-                parent = site.unrestrictedTraverse(path_list[:-1])
-                content = parent.restrictedTraverse(path_list[-1])
-            else:
-                content = site.restrictedTraverse(path[-1])
+            return _traverse_to_content(site, site_path, path, parents)
         except (KeyError, AttributeError):
             return None  # When no object is found don't raise an error
-        else:
-            # Only return a content if it implements DynamicType,
-            # which is true for Dexterity content and Comment (plone.app.discussion)
-            return content if isinstance(content, DynamicType) else None
 
     elif UID:
         return uuidToObject(UID)
     return None
 
 
+@mutually_exclusive_parameters("UIDs", "paths")
+@at_least_one_of("UIDs", "paths")
+def get_many(
+    UIDs: Iterable[str] | None = None,
+    paths: Iterable[str] | None = None,
+    unrestricted: bool = False,
+) -> list[Content | None]:
+    """Get many objects at once.
+
+    All UIDs are looked up with a single catalog query, instead of one
+    query per UID as with :func:`~plone.api.content.get`.
+
+    :param UIDs: UIDs of the objects we want to get.
+    :type UIDs: iterable of strings
+    :param paths: Paths to the objects we want to get, relative to the
+        portal root.
+    :type paths: iterable of strings
+    :param unrestricted: Boolean, get the objects without checking if the
+        current user may access them.
+    :returns: The objects in the order of ``UIDs`` or ``paths``, with
+        ``None`` for objects that cannot be found or accessed.
+    :rtype: list
+    :Example: :ref:`content-get-many-example`
+    """
+    if paths is not None:
+        return _traverse_paths(paths, unrestricted)
+
+    UIDs = list(UIDs or ())
+    if not UIDs:
+        return []
+    catalog = portal.get_tool("portal_catalog")
+    found = {
+        brain.UID: brain.getPath()
+        for brain in catalog.unrestrictedSearchResults(UID=UIDs)
+    }
+    return _traverse_paths(
+        (found.get(uid) for uid in UIDs), unrestricted, absolute=True
+    )
+
+
 @required_parameters("source")
 @at_least_one_of("target", "id")
 def move(
@@ -310,15 +583,440 @@ def copy(
         return target[new_id]
 
 
+def _paste_many(
+    sources: Iterable[Content],
+    target: Container,
+    move: bool,
+) -> tuple[list[str], dict[str, str]]:
+    """Cut or copy the sources, one call per parent, and paste them at once.
+
+    Returns the paths of the sources in order, and a mapping of these paths
+    to the new ids in the target.
+    """
+    sources = {"/".join(source.getPhysicalPath()): source for source in sources}
+    groups: dict[tuple[str, ...], tuple[Container, dict[str, str]]] = {}
+    for path, source in sources.items():
+        parent = source.aq_parent
+        group = groups.setdefault(parent.getPhysicalPath(), (parent, {}))[1]
+        group[path] = source.getId()
+
+    paths: list[str] = []
+    monikers: list[Any] = []
+    for parent, group in groups.values():
+        ids = list(group.values())
+        if move:
+            clipboard = parent.manage_cutObjects(ids)
+        else:
+            clipboard = parent.manage_copyObjects(ids)
+        monikers.extend(_cb_decode(clipboard, 0)[1])
+        paths.extend(group)
+
+    if not monikers:
+        return [], {}
+    # Paste all objects in one go. Unlike manage_pasteObjects this does not
+    # limit the size of the clipboard, which is not user input here.
+    op, result = target._pasteObjects(_cb_encode((int(move), monikers)))
+    return list(sources), {path: info["new_id"] for path, info in zip(paths, result)}
+
+
+@required_parameters("sources", "target")
+def move_many(
+    sources: Iterable[Content],
+    target: Container,
+    as_dict: bool = False,
+) -> list[Content] | dict[str, str]:
+    """Move many objects to the target container.
+
+    The sources are cut with one call per container they are in, and pasted
+    into the target at once.
+
+    :param sources: [required] Objects that we want to move.
+    :type sources: iterable of content objects
+    :param target: [required] Target container to which the source objects
+        will be moved.
+    :type target: Folderish content object
+    :param as_dict: If true, return a dictionary mapping the path of each
+        source object to its new id in the target.
+    :type as_dict: boolean
+    :returns: Content objects that were moved to the target location, in
+        the order of ``sources``, or the dictionary of new ids.
+    :raises:
+        OFS.CopySupport.CopyError
+    :Example: :ref:`content-move-many-example`
+    """
+    paths, new_ids = _paste_many(sources, target, move=True)
+    if as_dict:
+        return new_ids
+    return [target[new_ids[path]] for path in paths]
+
+
+@required_parameters("sources", "target")
+def copy_many(
+    sources: Iterable[Content],
+    target: Container,
+    as_dict: bool = False,
+) -> list[Content] | dict[str, str]:
+    """Copy many objects to the target container.
+
+    The sources are copied with one call per container they are in, and
+    pasted into the target at once. Copies of objects whose id already
+    exists in the target get a new id.
+
+    :param sources: [required] Objects that we want to copy.
+    :type sources: iterable of content objects
+    :param target: [required] Target container to which the source objects
+        will be copied.
+    :type target: Folderish content object
+    :param as_dict: If true, return a dictionary mapping the path of each
+        source object to the id of its copy in the target.
+    :type as_dict: boolean
+    :returns: Content objects that were created in the target location, in
+        the order of ``sources``, or the dictionary of new ids.
+    :raises:
+        OFS.CopySupport.CopyError
+    :Example: :ref:`content-copy-many-example`
+    """
+    paths, new_ids = _paste_many(sources, target, move=False)
+    if as_dict:
+        return new_ids
+    return [target[new_ids[path]] for path in paths]
+
+
+@dataclass
+class CopyTreeStatus:
+    """Progress of a copy made with :func:`copy_tree`."""
+
+    source_path: str
+    copy_path: str
+    # Number of catalogued objects in the source, to show the progress.
+    total: int
+    # Number of objects in the copy, including those found when resuming.
+    copied: int = 0
+    # One of "running", "done" or "failed".
+    state: str = "running"
+    error: Exception | None = None
+    thread: threading.Thread | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Return whether the copy has finished, successfully or not."""
+        return self.state != "running"
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for a copy running in the background to finish.
+
+        :param timeout: Maximum number of seconds to wait.
+        :type timeout: float
+        :returns: Whether the copy has finished.
+        """
+        if self.thread is not None:
+            self.thread.join(timeout)
+        return self.done
+
+
+def _copy_blob(blob: Blob) -> Blob:
+    """Return a new blob with the data of the blob."""
+    copy = Blob()
+    with blob.open("r") as source, copy.open("w") as target:
+        shutil.copyfileobj(source, target)
+    return copy
+
+
+def _copy_without_items(source: Container) -> Container:
+    """Return an unattached copy of the folderish source, without its items.
+
+    The source is cloned by pickling it like ``zope.copy`` does, with the
+    items replaced by None, and the storage of the items is reset. Blobs
+    keep their data in files outside of the pickle, so they are copied
+    separately.
+    """
+    source = aq_base(source)
+    items = {id(item) for item in source._tree.values()}
+    blobs = []
+
+    def persistent_id(obj):
+        if id(obj) in items:
+            return "item"
+        if isinstance(obj, Blob):
+            blobs.append(obj)
+            return ("blob", len(blobs) - 1)
+        return None
+
+    def persistent_load(pid):
+        if pid == "item":
+            return None
+        return _copy_blob(blobs[pid[1]])
+
+    with tempfile.TemporaryFile() as f:
+        pickler = Pickler(f, protocol=-1)
+        pickler.persistent_id = persistent_id
+        pickler.dump(source)
+        f.seek(0)
+        unpickler = Unpickler(f)
+        unpickler.persistent_load = persistent_load
+        copy = unpickler.load()
+
+    copy._initBTrees()
+    annotations = IAnnotations(copy, None)
+    if annotations is not None:
+        annotations.pop(DefaultOrdering.ORDER_KEY, None)
+        annotations.pop(DefaultOrdering.POS_KEY, None)
+    return copy
+
+
+def _paste_copy(
+    source: Content,
+    target: Container,
+    id: str,
+    with_items: bool = True,
+) -> Content:
+    """Copy the source into the target, optionally without its items.
+
+    This sends the same events as pasting a copy with ``manage_pasteObjects``.
+    """
+    target._verifyObjectPaste(source, validate_src=1)
+    source._notifyOfCopyTo(target, op=0)
+
+    if with_items:
+        copy = source._getCopy(target)
+    else:
+        copy = _copy_without_items(source)
+    copy._setId(id)
+    notify(ObjectCopiedEvent(copy, source))
+    target._setObject(id, copy)
+    copy = target._getOb(id)
+    copy.wl_clearLocks()
+    copy._postCopy(target, op=0)
+    compatibilityCall("manage_afterClone", copy, copy)
+    notify(ObjectClonedEvent(copy))
+    return copy
+
+
+def _inaccessible_message(items: Iterable[Content | str]) -> str:
+    """Return the error for items copy_tree() may not copy."""
+    paths = sorted(
+        item if isinstance(item, str) else "/".join(item.getPhysicalPath())
+        for item in items
+    )
+    return "Not allowed to view these items, which would be left out:\n{}".format(
+        "\n".join(paths)
+    )
+
+
+def _copy_tree(site: Container, status: CopyTreeStatus, batch_size: int):
+    """Copy the source of status item by item, committing every batch."""
+    source = site.unrestrictedTraverse(status.source_path)
+    target_path, copy_id = status.copy_path.rpartition("/")[::2]
+    target = site.unrestrictedTraverse(target_path)
+    check_permission = getSecurityManager().checkPermission
+    # Count the objects copied before resuming or retrying as well.
+    status.copied = 0
+    uncommitted = 0
+
+    def copied(count: int):
+        nonlocal uncommitted
+        status.copied += count
+        uncommitted += count
+        if uncommitted >= batch_size:
+            transaction.commit()
+            site._p_jar.cacheGC()
+            uncommitted = 0
+
+    if copy_id in target:
+        copy = target[copy_id]
+        status.copied += 1
+    elif isinstance(aq_base(source), BTreeFolder2Base):
+        copy = _paste_copy(source, target, copy_id, with_items=False)
+        copied(1)
+    else:
+        _paste_many([source], target, move=False)
+        copied(1)
+        copy = None
+
+    stack = [(source, copy)] if copy is not None else []
+    while stack:
+        source, copy = stack.pop()
+        # Items are pasted in chunks, in the order of the source.
+        items: list[Content] = []
+
+        def paste_items():
+            if items:
+                _paste_many(items, copy, move=False)
+                copied(len(items))
+                items.clear()
+
+        for item_id, item in source.objectItems():
+            is_folder = isinstance(aq_base(item), BTreeFolder2Base)
+            if item_id in copy:
+                status.copied += 1
+                if is_folder:
+                    stack.append((item, copy[item_id]))
+            elif is_folder:
+                paste_items()
+                folder = _paste_copy(item, copy, item_id, with_items=False)
+                stack.append((item, folder))
+                copied(1)
+            elif check_permission("View", item):
+                items.append(item)
+                if len(items) >= batch_size - uncommitted:
+                    paste_items()
+            else:
+                # copy_tree checks this for catalogued items up front.
+                raise CopyError(_inaccessible_message([item]))
+        paste_items()
+
+    transaction.commit()
+    status.state = "done"
+
+
+def _copy_tree_worker(
+    db: DB,
+    site_path: str,
+    user: Any,
+    status: CopyTreeStatus,
+    batch_size: int,
+):
+    """Copy a tree with an own connection to the database."""
+    connection = db.open()
+    try:
+        app = makerequest(connection.root()["Application"])
+        setRequest(app.REQUEST)
+        site = app.unrestrictedTraverse(site_path)
+        setSite(site)
+        with env.adopt_user(user=user):
+            for attempt in range(MAX_COPY_TREE_ATTEMPTS):
+                try:
+                    _copy_tree(site, status, batch_size)
+                except ConflictError:
+                    # Resume with what has been committed so far.
+                    transaction.abort()
+                    if attempt + 1 == MAX_COPY_TREE_ATTEMPTS:
+                        raise
+                else:
+                    break
+    except Exception as error:
+        transaction.abort()
+        logger.exception("Copying %s failed.", status.source_path)
+        status.error = error
+        status.state = "failed"
+    finally:
+        setSite(None)
+        setRequest(None)
+        connection.close()
+
+
+@required_parameters("source", "target")
+def copy_tree(
+    source: Content,
+    target: Container,
+    id: str | None = None,
+    batch_size: int = 100,
+    background: bool = False,
+    resume: bool = False,
+) -> CopyTreeStatus:
+    """Copy the object and everything inside it, committing in batches.
+
+    Unlike :func:`~plone.api.content.copy`, the items are copied one
+    container at a time and the transaction is committed after every
+    ``batch_size`` items, so copying large folders does not need one
+    huge transaction. Folders are copied without their items first, the
+    items follow.
+
+    :param source: [required] Object that we want to copy.
+    :type source: Content object
+    :param target: [required] Target container to which the source object
+        will be copied.
+    :type target: Folderish content object
+    :param id: Id of the copy. Defaults to the id of the source. If there
+        already is an object with this id in the target, a prefix is added,
+        unless resuming.
+    :type id: string
+    :param batch_size: Number of objects copied per transaction.
+    :type batch_size: int
+    :param background: Copy in a thread with its own connection to the
+        database, and return right away. The source and the target must be
+        committed already.
+    :type background: boolean
+    :param resume: Continue an interrupted copy: an existing object with
+        the id in the target is taken to be the copy, and only the items
+        missing in it are copied.
+    :type resume: boolean
+    :returns: Status of the copy, which can be polled while copying in the
+        background.
+    :rtype: CopyTreeStatus
+    :raises:
+        InvalidParameterError,
+        OFS.CopySupport.CopyError if the user may not view some of the
+        items. What has been committed before is kept.
+    :Example: :ref:`content-copy-tree-example`
+    """
+    if batch_size < 1:
+        raise InvalidParameterError("batch_size must be at least 1.")
+
+    source_path = "/".join(source.getPhysicalPath())
+    target_path = "/".join(target.getPhysicalPath())
+    if target_path == source_path or target_path.startswith(f"{source_path}/"):
+        raise InvalidParameterError("Cannot copy an object into itself.")
+
+    id = id or source.getId()
+    if not resume:
+        id = target._get_id(id)
+
+    # Copying a container leaves out the items the user may not view, see
+    # OFS.CopySupport.CopySource._cleanupCopy. Rather than leaving them out
+    # of a copy made in many transactions, refuse to copy. The catalog only
+    # knows who may access the items, viewing them is checked while copying.
+    catalog = portal.get_tool("portal_catalog")
+    paths = {
+        brain.getPath() for brain in catalog.unrestrictedSearchResults(path=source_path)
+    }
+    inaccessible = paths.difference(
+        brain.getPath() for brain in catalog(path=source_path, show_inactive=True)
+    )
+    if inaccessible:
+        raise CopyError(_inaccessible_message(inaccessible))
+
+    status = CopyTreeStatus(
+        source_path=source_path,
+        copy_path=f"{target_path}/{id}",
+        total=len(paths),
+    )
+
+    site = portal.get()
+    if not background:
+        _copy_tree(site, status, batch_size)
+        return status
+
+    status.thread = threading.Thread(
+        target=_copy_tree_worker,
+        args=(
+            site._p_jar.db(),
+            "/".join(site.getPhysicalPath()),
+            getSecurityManager().getUser(),
+            status,
+            batch_size,
+        ),
+        name=f"copy_tree {source_path}",
+        daemon=True,
+    )
+    status.thread.start()
+    return status
+
+
 @mutually_exclusive_parameters("obj", "objects")
 @at_least_one_of("obj", "objects")
 def delete(
     obj: Content | None = None,
     objects: list[Content] | None = None,
     check_linkintegrity: bool = True,
+    batch_size: int = 1000,
 ):
     """Delete the object(s).
 
+    Objects are deleted with one ``manage_delObjects`` call per container
+    and batch. Objects inside other objects that are deleted as well are
+    skipped, they go away with their container.
+
     :param obj: Object that we want to delete.
     :type obj: Content object
     :param objects: Objects that we want to delete.
@@ -326,6 +1024,10 @@ def delete(
     :param check_linkintegrity: Raise exception if there are
         linkintegrity-breaches.
     :type check_linkintegrity: boolean
+    :param batch_size: Maximum number of objects deleted from a container
+        in one go. A savepoint is made and the progress is logged after
+        each batch when deleting more objects than this.
+    :type batch_size: int
 
     :raises:
         ValueError
@@ -333,6 +1035,9 @@ def delete(
 
     :Example: :ref:`content-delete-example`
     """
+    if batch_size < 1:
+        raise InvalidParameterError("batch_size must be at least 1.")
+
     objects = [obj] if obj else objects
 
     # Return early if we have no objects to delete.
@@ -340,21 +1045,36 @@ def delete(
         return
 
     if check_linkintegrity:
-        site = portal.get()
-        linkintegrity_view = get_view(
-            name="delete_confirmation_info",
-            context=site,
-            request=site.REQUEST,
-        )
         # look for breaches and manually raise a exception
-        breaches = linkintegrity_view.get_breaches(objects)
+        breaches = [
+            (breach.from_path, breach.to_path)
+            for breach in relation.iter_breaches(objects)
+        ]
         if breaches:
             raise LinkIntegrityNotificationException(
                 f"Linkintegrity-breaches: {breaches}",
             )
 
-    for obj_ in objects:
-        obj_.aq_parent.manage_delObjects([obj_.getId()])
+    # Group the ids by container, in order, skipping duplicates and objects
+    # that are deleted with one of their parents anyway.
+    paths = {obj_.getPhysicalPath(): obj_ for obj_ in objects}
+    groups: dict[tuple[str, ...], tuple[Container, list[str]]] = {}
+    for path, obj_ in paths.items():
+        if any(path[:depth] in paths for depth in range(1, len(path))):
+            continue
+        parent = obj_.aq_parent
+        groups.setdefault(path[:-1], (parent, []))[1].append(obj_.getId())
+
+    total = sum(len(ids) for parent, ids in groups.values())
+    deleted = 0
+    for parent, ids in groups.values():
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start : start + batch_size]
+            parent.manage_delObjects(batch)
+            deleted += len(batch)
+            if total > batch_size:
+                transaction.savepoint(optimistic=True)
+                logger.info("Deleted %d of %d objects.", deleted, total)
 
 
 @required_parameters("obj")
@@ -380,45 +1100,146 @@ def get_state(obj: Content, default: Any = _marker) -> str:
     return workflow.getInfoFor(ob=obj, name="review_state")
 
 
-# work backwards from our end state
-def _find_path(
-    maps: dict[str, list[tuple[str, list[str]]]],
-    path: list[str | Any],
-    current_state: str,
-    start_state: str,
-) -> list[str] | None:
-    paths = []
-    # current_state could not be on maps if it only has outgoing
-    # transitions. i.e an initial state you are not able to return to.
-    if current_state not in maps:
-        return None
+@required_parameters("items")
+def get_states(
+    items: Iterable[Content | ICatalogBrain | str],
+    default: Any = None,
+    unrestricted: bool = False,
+) -> dict[str, Any]:
+    """Get the current workflow state of many objects at once.
+
+    The states are read from the ``review_state`` catalog metadata, so the
+    objects do not need to be loaded. Only objects that are not cataloged
+    are asked for their state through the workflow tool.
+
+    :param items: [required] Objects, catalog brains or UIDs that we want
+        to get the state for.
+    :type items: iterable
+    :param default: Returned for items that have no workflow state.
+    :param unrestricted: Boolean, also look up UIDs of objects the current
+        user may not access.
+    :returns: Mapping of UID to workflow state, in the order of ``items``.
+        UIDs that cannot be found or accessed are left out.
+    :rtype: dict
+    :Example: :ref:`content-get-states-example`
+    """
+    catalog = portal.get_tool("portal_catalog")
+    has_metadata = "review_state" in catalog.schema()
+
+    uids: list[str] = []
+    objects: dict[str, Content] = {}
+    states: dict[str, Any] = {}
+    for item in items:
+        if isinstance(item, str):
+            uids.append(item)
+        elif ICatalogBrain.providedBy(item):
+            uids.append(item.UID)
+            if has_metadata:
+                states[item.UID] = item.review_state or default
+            else:
+                objects[item.UID] = item.getObject()
+        else:
+            uid = IUUID(item)
+            uids.append(uid)
+            objects[uid] = item
+
+    missing = [uid for uid in uids if uid not in states]
+    if missing:
+        if unrestricted:
+            brains = catalog.unrestrictedSearchResults(UID=missing)
+        else:
+            brains = catalog(UID=missing)
+        for brain in brains:
+            if has_metadata:
+                states[brain.UID] = brain.review_state or default
+            elif brain.UID not in objects:
+                if unrestricted:
+                    objects[brain.UID] = brain._unrestrictedGetObject()
+                else:
+                    objects[brain.UID] = brain.getObject()
+
+    # Fall back to the workflow tool for everything the catalog could not
+    # answer.
+    for uid, obj in objects.items():
+        if uid not in states:
+            states[uid] = get_state(obj, default=default)
+
+    return {uid: states[uid] for uid in uids if uid in states}
+
+
+# Routing tables of the workflow definitions, see ``_wf_routes_for``.
+_wf_routes: dict[Any, tuple[tuple, dict[str, dict[str, tuple[str, ...]]]]] = {}
+
+
+def _wf_signature(workflow: DCWorkflowDefinition) -> tuple:
+    """Return a marker that changes whenever states or transitions change."""
+    return (
+        tuple(
+            (state.getId(), tuple(state.getTransitions()))
+            for state in workflow.states.objectValues()
+        ),
+        tuple(
+            (transition.getId(), transition.new_state_id)
+            for transition in workflow.transitions.objectValues()
+        ),
+    )
 
-    for new_transition, from_states in maps[current_state]:
-        next_path = _copy(path)
-        if new_transition in path:
-            # Don't go in a circle
-            continue
 
-        next_path.insert(0, new_transition)
-        if start_state in from_states:
-            paths.append(next_path)
-            continue
+def _wf_routes_for(
+    workflow: DCWorkflowDefinition,
+) -> dict[str, dict[str, tuple[str, ...]]]:
+    """Get the shortest transition routes between all states of a workflow.
 
-        for state in from_states:
-            recursive_paths = _find_path(
-                maps,
-                next_path,
-                state,
-                start_state,
-            )
-            if recursive_paths:
-                paths.append(recursive_paths)
+    The table is computed with a breadth-first search from every state and
+    cached per workflow definition. It is recomputed when the states or
+    transitions of the definition change.
 
-    return len(paths) and min(paths, key=len) or None
+    :param workflow: Workflow object which contains states and transitions
+    :type workflow: Workflow object
+    :returns: Mapping of from_state to a mapping of reachable to_state to
+        the transition ids leading there
+    :rtype: dict
+    """
+    key = getattr(workflow, "_p_oid", None) or id(workflow)
+    signature = _wf_signature(workflow)
+    cached = _wf_routes.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    states, transitions = signature
+    new_states = dict(transitions)
+    exits = {
+        state_id: [
+            (transition_id, new_states[transition_id])
+            for transition_id in transition_ids
+            # Transitions without a new state remain in the current state.
+            if new_states.get(transition_id)
+        ]
+        for state_id, transition_ids in states
+    }
+
+    routes: dict[str, dict[str, tuple[str, ...]]] = {}
+    for from_state in exits:
+        found: dict[str, tuple[str, ...]] = {from_state: ()}
+        queue = deque([from_state])
+        while queue:
+            state_id = queue.popleft()
+            for transition_id, new_state in exits.get(state_id, ()):
+                if new_state not in found:
+                    found[new_state] = found[state_id] + (transition_id,)
+                    queue.append(new_state)
+        del found[from_state]
+        routes[from_state] = found
+
+    _wf_routes[key] = (signature, routes)
+    return routes
 
 
 def _wf_transitions_for(
-    workflow: DCWorkflowDefinition, from_state: str, to_state: str
+    workflow: DCWorkflowDefinition,
+    from_state: str,
+    to_state: str,
+    routes: dict[str, dict[str, tuple[str, ...]]] | None = None,
 ) -> list[str] | None:
     """Get list of transition IDs required to transition.
 
@@ -430,37 +1251,25 @@ def _wf_transitions_for(
     :type from_state: string
     :param to_state: Desired workflow state
     :type to_state: string
+    :param routes: Routing table of the workflow, as returned by
+        ``_wf_routes_for``. Looked up if not given.
+    :type routes: dict
     :returns: A list of transitions
     :rtype: list
     """
-    exit_state_maps: dict[str, list[str]] = {}
-    for state in workflow.states.objectValues():
-        for transition in state.getTransitions():
-            exit_state_maps.setdefault(transition, [])
-            exit_state_maps[transition].append(state.getId())
-
-    transition_maps = {}
-    for transition in workflow.transitions.objectValues():
-        value = (
-            transition.getId(),
-            exit_state_maps.get(transition.getId(), []),
-        )
-        if transition.new_state_id not in transition_maps:
-            transition_maps[transition.new_state_id] = [value]
-        else:
-            transition_maps[transition.new_state_id].append(value)
-
-    if to_state not in transition_maps:
-        # impossible to reach via this workflow
-        return None
-
-    return _find_path(transition_maps, [], to_state, from_state)
+    if routes is None:
+        routes = _wf_routes_for(workflow)
+    route = routes.get(from_state, {}).get(to_state)
+    # An empty or missing route means to_state cannot be reached.
+    return list(route) if route else None
 
 
 def _transition_to(
     obj: Content,
     workflow: WorkflowTool,
     to_state: str,
+    routes: dict[str, dict] | None = None,
+    /,
     **kwargs,
 ):
     # move from the current state to the given state
@@ -472,10 +1281,19 @@ def _transition_to(
         if status["review_state"] == to_state:
             return
 
+        # When transitioning many objects, the routing tables are looked
+        # up only once per workflow.
+        wf_routes = None
+        if routes is not None:
+            wf_routes = routes.get(wf.getId())
+            if wf_routes is None:
+                wf_routes = routes[wf.getId()] = _wf_routes_for(wf)
+
         transitions = _wf_transitions_for(
             wf,
             status["review_state"],
             to_state,
+            wf_routes,
         )
         if not transitions:
             continue
@@ -546,6 +1364,70 @@ def transition(
             )
 
 
+@required_parameters("objects")
+@at_least_one_of("transition", "to_state")
+@mutually_exclusive_parameters("transition", "to_state")
+def transition_many(
+    objects: Iterable[Content],
+    transition: str | None = None,
+    to_state: str | None = None,
+    **kwargs,
+) -> dict[str, PloneApiError | WorkflowException | None]:
+    """Perform a workflow transition on many objects.
+
+    Works like :func:`~plone.api.content.transition`, but a failing object
+    does not abort the whole batch. With ``to_state``, the route to the
+    desired state is computed only once per workflow and current state.
+
+    The catalog updates of all objects are collected in the indexing queue
+    and processed in a single pass at the end, instead of once per object.
+
+    Accepts kwargs to supply to the workflow policy in use, such as "comment"
+
+    :param objects: [required] Objects for which we want to perform the
+        workflow transition.
+    :type objects: iterable of content objects
+    :param transition: Name of the workflow transition.
+    :type transition: string
+    :param to_state: Name of the workflow state.
+    :type to_state: string
+    :returns: Mapping of UID to ``None`` for objects that were transitioned
+        and to the raised exception for objects that failed, in the order of
+        ``objects``.
+    :rtype: dict
+    :raises:
+        :class:`~plone.api.exc.MissingParameterError`,
+        :class:`~plone.api.exc.InvalidParameterError`
+    :Example: :ref:`content-transition-many-example`
+    """
+    workflow = portal.get_tool("portal_workflow")
+    routes: dict[str, dict] = {}
+    results: dict[str, PloneApiError | WorkflowException | None] = {}
+
+    for obj in objects:
+        uid = IUUID(obj)
+        try:
+            if transition is not None:
+                workflow.doActionFor(obj, transition, **kwargs)
+            else:
+                assert isinstance(to_state, str)
+                _transition_to(obj, workflow, to_state, routes, **kwargs)
+                if workflow.getInfoFor(obj, "review_state") != to_state:
+                    raise InvalidParameterError(
+                        "Could not find workflow to set state to {} on {}".format(
+                            to_state,
+                            obj,
+                        ),
+                    )
+        except (PloneApiError, WorkflowException) as e:
+            results[uid] = e
+        else:
+            results[uid] = None
+
+    processQueue()
+    return results
+
+
 @required_parameters("obj")
 def disable_roles_acquisition(obj: Content):
     """Disable acquisition of local roles on given obj.
@@ -599,29 +1481,27 @@ def get_view(
     # available, because the __init__ of said view will contain
     # errors in client code.
 
-    try:
-        return getMultiAdapter((context, request), name=name)
-    except ComponentLookupError:
-        # Getting all available views
-        sm = getSiteManager()
-        available_views = sm.adapters.lookupAll(
-            required=(providedBy(context), providedBy(request)),
-            provided=Interface,
+    # The adapter registry memoises the factory per required interfaces and
+    # name, and drops that cache whenever it or one of its bases changes.
+    adapters = getSiteManager().adapters
+    required = (providedBy(context), providedBy(request))
+    factory = adapters.lookup(required, Interface, name=name)
+    # Like getMultiAdapter, a factory returning None counts as a miss.
+    view = factory(context, request) if factory is not None else None
+    if view is not None:
+        return view
+
+    def available_views():
+        # Enumerating all views registered for the context and request is
+        # expensive, so it only happens when the message is formatted.
+        views = adapters.lookupAll(required, Interface)
+        return "Available views are:\n{views}".format(
+            views="\n".join(sorted(registered[0] for registered in views)),
         )
 
-        # Check if the requested view is available
-        # by getting the names of all available views
-        available_view_names = [view[0] for view in available_views]
-        if name not in available_view_names:
-            # Raise an error if the requested view is not available.
-            raise InvalidParameterError(
-                "Cannot find a view with name '{name}'.\n"
-                "Available views are:\n"
-                "{views}".format(
-                    name=name,
-                    views="\n".join(sorted(available_view_names)),
-                ),
-            )
+    raise _LazyInvalidParameterError(
+        f"Cannot find a view with name '{name}'.", available_views
+    )
 
 
 @required_parameters("obj")
@@ -711,23 +1591,47 @@ def _parse_object_provides_query(query: Any) -> dict[str, str | list[str]]:
     return result
 
 
-def find(
+# Query parameters that are understood by the catalog but are no indexes.
+QUERY_PARAMETERS = frozenset(
+    ("sort_on", "sort_order", "sort_limit", "b_start", "b_size", "show_inactive")
+)
+
+
+def _catalog_indexes(catalog: Any) -> frozenset[str]:
+    """Get the names of the catalog indexes.
+
+    The names are cached on the catalog in a volatile attribute. The cache
+    is dropped when the catalog is modified, which is the case when indexes
+    are added or removed, and when the catalog is invalidated by another
+    connection.
+    """
+    _catalog = catalog._catalog
+    indexes = getattr(_catalog, "_v_plone_api_indexes", None)
+    if _catalog._p_changed:
+        # Changed in this transaction, but not yet committed.
+        _catalog._v_plone_api_indexes = indexes = None
+        return frozenset(catalog.indexes())
+    if indexes is None:
+        indexes = frozenset(catalog.indexes())
+        if _catalog._p_jar is not None:
+            _catalog._v_plone_api_indexes = indexes
+    return indexes
+
+
+def _parse_query(
+    catalog: Any,
     context: Content | None = None,
     depth: int | None = None,
-    unrestricted: bool = False,
     **kwargs,
-) -> LazyMap | LazyCat:
-    """Find content in the portal.
+) -> tuple[dict[str, Any], list[str]]:
+    """Normalize a catalog query.
 
-    :param context: Content for the search
-    :type obj: Content object
-    :param depth: How far in the content tree we want to search from context
-    :param unrestricted: Boolean, use unrestrictedSearchResults if True
-    :type obj: Content object
-    :returns: Catalog brains
-    :rtype: List
-    :Example: :ref:`content-find-example`
+    Turns ``context`` and ``depth`` into a ``path`` query and interfaces into
+    an ``object_provides`` query.
 
+    :returns: The normalized query and the names of the query parameters
+        the catalog does not know about
+    :rtype: tuple
     """
     query: dict[str, Any] = {}
     query.update(**kwargs)
@@ -763,11 +1667,123 @@ def find(
     if obj_provides:
         query["object_provides"] = _parse_object_provides_query(obj_provides)
 
-    # Make sure we don't dump the whole catalog.
+    indexes = _catalog_indexes(catalog)
+    unknown = [
+        key for key in query if key not in indexes and key not in QUERY_PARAMETERS
+    ]
+    return query, unknown
+
+
+@lru_cache(maxsize=128)
+def _row_type(fields: tuple[str, ...]) -> type[tuple]:
+    """Return a compact named tuple type for rows with the given fields."""
+    return namedtuple("Row", fields, rename=True)
+
+
+def _project(
+    brains: Iterable[ICatalogBrain],
+    fields: tuple[str, ...],
+    as_columns: bool,
+) -> list[tuple] | dict[str, list[Any]]:
+    """Read the given metadata fields of the brains into plain rows.
+
+    The special field ``path`` holds the path of the cataloged object.
+    """
+    getters = [
+        methodcaller("getPath") if field == "path" else attrgetter(field)
+        for field in fields
+    ]
+    if as_columns:
+        columns: dict[str, list[Any]] = {field: [] for field in fields}
+        appenders = [columns[field].append for field in fields]
+        for brain in brains:
+            for append, getter in zip(appenders, getters):
+                append(getter(brain))
+        return columns
+
+    row_type = _row_type(fields)
+    return [row_type(*[getter(brain) for getter in getters]) for brain in brains]
+
+
+def find(
+    context: Content | None = None,
+    depth: int | None = None,
+    unrestricted: bool = False,
+    fields: Iterable[str] | None = None,
+    as_rows: bool = False,
+    as_columns: bool = False,
+    **kwargs,
+) -> LazyMap | LazyCat | list[tuple] | dict[str, list[Any]]:
+    """Find content in the portal.
+
+    By default catalog brains are returned. Pass ``fields`` or ``as_rows``
+    to get plain rows with the catalog metadata instead. The rows do not
+    keep the catalog or any acquisition wrappers alive, which makes them
+    cheap to hold and to serialize.
+
+    :param context: Content for the search
+    :type obj: Content object
+    :param depth: How far in the content tree we want to search from context
+    :param unrestricted: Boolean, use unrestrictedSearchResults if True
+    :type obj: Content object
+    :param fields: Names of the metadata columns to return for each result.
+        The special name ``path`` returns the path of the object. Defaults to
+        all metadata columns when ``as_rows`` or ``as_columns`` is set.
+    :type fields: iterable of strings
+    :param as_rows: Boolean, return a list of named tuples instead of brains.
+    :param as_columns: Boolean, return a dictionary mapping each field to the
+        list of its values instead of brains.
+    :returns: Catalog brains, rows or columns
+    :rtype: List
+    :raises:
+        :class:`~plone.api.exc.InvalidParameterError`
+    :Example: :ref:`content-find-example`
+
+    """
     catalog = portal.get_tool("portal_catalog")
-    indexes = catalog.indexes()
-    valid_indexes = [index for index in query if index in indexes]
-    if not valid_indexes:
+
+    if fields is not None or as_rows or as_columns:
+        columns = catalog.schema()
+        if fields is None:
+            fields = columns
+        fields = tuple(fields)
+        if not fields:
+            raise InvalidParameterError("The 'fields' parameter cannot be empty.")
+        unknown = [
+            field for field in fields if field != "path" and field not in columns
+        ]
+        if unknown:
+            raise InvalidParameterError(
+                "Cannot find the metadata column(s) {unknown}.\n"
+                "Available columns are:\n"
+                "{columns}".format(
+                    unknown=", ".join(unknown),
+                    columns="\n".join(sorted(columns)),
+                ),
+            )
+        results = _find_brains(catalog, context, depth, unrestricted, **kwargs)
+        return _project(results, fields, as_columns)
+
+    return _find_brains(catalog, context, depth, unrestricted, **kwargs)
+
+
+def _find_brains(
+    catalog: Any,
+    context: Content | None,
+    depth: int | None,
+    unrestricted: bool,
+    **kwargs,
+) -> LazyMap | LazyCat | list:
+    """Query the catalog for the brains of :func:`find`."""
+    query, unknown = _parse_query(catalog, context=context, depth=depth, **kwargs)
+    if unknown:
+        logger.warning(
+            "Ignoring unknown catalog query parameter(s): %s",
+            ", ".join(unknown),
+        )
+
+    # Make sure we don't dump the whole catalog.
+    if _catalog_indexes(catalog).isdisjoint(query):
         return []
 
     if unrestricted:
@@ -776,6 +1792,120 @@ def find(
         return catalog(**query)
 
 
+def find_iter(
+    context: Content | None = None,
+    depth: int | None = None,
+    unrestricted: bool = False,
+    chunk_size: int = 1000,
+    minimize_cache: bool = True,
+    **kwargs,
+) -> Iterator[Content]:
+    """Find content in the portal and iterate over the objects.
+
+    Takes the same query parameters as :func:`~plone.api.content.find`, but
+    returns the objects instead of the catalog brains. The objects are loaded
+    in chunks of ``chunk_size``, and the ZODB connection cache is minimized
+    after every chunk, so memory stays flat while walking large result sets.
+
+    Objects with unsaved changes are not removed from the cache. Make a
+    savepoint regularly when modifying the objects.
+
+    :param context: Content for the search
+    :type obj: Content object
+    :param depth: How far in the content tree we want to search from context
+    :param unrestricted: Boolean, use unrestrictedSearchResults and get the
+        objects without security checks if True. Use this for read-only jobs.
+    :param chunk_size: Number of objects to load between two cache
+        minimizations.
+    :type chunk_size: integer
+    :param minimize_cache: Boolean, minimize the connection cache after every
+        chunk.
+    :returns: Iterator of content objects
+    :rtype: iterator
+    :raises:
+        :class:`~plone.api.exc.InvalidParameterError`
+    :Example: :ref:`content-find-iter-example`
+    """
+    if chunk_size < 1:
+        raise InvalidParameterError("The 'chunk_size' parameter must be positive.")
+    projection = sorted({"fields", "as_rows", "as_columns"}.intersection(kwargs))
+    if projection:
+        raise InvalidParameterError(
+            "find_iter() returns objects and does not support the parameter(s) "
+            "{}.".format(", ".join(projection))
+        )
+
+    catalog = portal.get_tool("portal_catalog")
+    brains = _find_brains(catalog, context, depth, unrestricted, **kwargs)
+    connection = portal.get()._p_jar
+    for start in range(0, len(brains), chunk_size):
+        for brain in brains[start : start + chunk_size]:
+            if unrestricted:
+                yield brain._unrestrictedGetObject()
+            else:
+                yield brain.getObject()
+
+        if minimize_cache and connection is not None:
+            connection.cacheMinimize()
+
+
+# Per thread: (request, transaction, ancestors by parent) of the last
+# ancestor lookup, kept while the lookup cache of plone.api.portal is enabled.
+_ancestor_cache = threading.local()
+
+
+def _invalidate_ancestor_cache(event: IObjectMovedEvent):
+    """Forget the chains of parents when an object is moved or removed."""
+    _ancestor_cache.entry = None
+
+
+def _iter_parents(obj: Content) -> Iterator[Container | RequestContainer]:
+    """Iterate over the containment parents of obj, from immediate to root.
+
+    The parents are walked lazily. While the lookup cache is enabled, the
+    chains of parents are kept for the rest of the request and transaction
+    instead, so items in the same container share them. Moving or removing
+    an object drops the chains.
+    """
+    parent = aq_parent(aq_inner(obj))
+    if not portal.LOOKUP_CACHE_ENABLED:
+        _ancestor_cache.entry = None
+        while parent is not None:
+            yield parent
+            parent = aq_parent(aq_inner(parent))
+        return
+
+    request, txn = getRequest(), transaction.get()
+    entry = getattr(_ancestor_cache, "entry", None)
+    if entry is None or entry[0] is not request or entry[1] is not txn:
+        entry = _ancestor_cache.entry = (request, txn, {})
+    chains: dict[int, tuple[Container | RequestContainer, ...]] = entry[2]
+
+    # Walk up to the first parent with a known chain, then add the chains
+    # of the parents on the way from the top down.
+    chain: tuple[Container | RequestContainer, ...] = ()
+    missing = []
+    while parent is not None:
+        known = chains.get(id(aq_base(parent)))
+        if known is not None:
+            chain = known
+            break
+        missing.append(parent)
+        parent = aq_parent(aq_inner(parent))
+    for parent in reversed(missing):
+        chain = (parent, *chain)
+        chains[id(aq_base(parent))] = chain
+    yield from chain
+
+
+def _until(iterable: Iterable, predicate: Callable) -> Iterator:
+    """Iterate up to and including the first item matching the predicate."""
+    for item in iterable:
+        yield item
+        if predicate(item):
+            return
+
+
 @required_parameters("obj")
 def iter_ancestors(
     obj: Content,
@@ -812,29 +1942,26 @@ def iter_ancestors(
     if stop_at is _marker:
         stop_at = portal.get()
 
-    if obj is stop_at:
+    if stop_at and aq_base(obj) is aq_base(stop_at):
         # We should iterate over the ancestors of obj but obj is also
         # the object at which we should stop checking for ancestors.
         # So we should return an empty iterator.
         #
         # This is useful if we want to have an empty iterator when checking
         # for ancestors in the portal.
-        yield from ()
-
-    chain = aq_chain(aq_inner(obj))
+        return
 
-    if stop_at:
-        try:
-            end = chain.index(stop_at) + 1
-        except ValueError:
-            raise InvalidParameterError(
-                f"The object {stop_at!r} is not in the acquisition chain of {obj!r}"
-            )
-    else:
-        end = None
+    if stop_at and not aq_inContextOf(obj, stop_at, True):
+        raise InvalidParameterError(
+            f"The object {stop_at!r} is not in the acquisition chain of {obj!r}"
+        )
 
     ancestors: Iterator[Container | RequestContainer] | Any
-    ancestors = islice(chain, 1, end)
+    ancestors = _iter_parents(obj)
+
+    if stop_at:
+        stop_at = aq_base(stop_at)
+        ancestors = _until(ancestors, lambda ancestor: aq_base(ancestor) is stop_at)
 
     if interface is not None:
         ancestors = filter(interface.providedBy, ancestors)
@@ -876,3 +2003,75 @@ def get_closest_ancestor(
         ),
         None,
     )
+
+
+@required_parameters("items", "interface")
+def get_closest_ancestors(
+    items: Iterable[Content | ICatalogBrain],
+    interface: InterfaceClass,
+) -> list[Content | None]:
+    """Get the closest ancestor providing the interface for many items.
+
+    Unlike calling :func:`~plone.api.content.get_closest_ancestor` for each
+    item, the ancestors are not traversed to. They are looked up with one
+    catalog query on the ``object_provides`` index, and only the matching
+    ancestors are loaded, once each. As with ``get_closest_ancestor``, the
+    portal is the last ancestor considered.
+
+    :param items: [required] Objects or catalog brains for which we want to
+        get the ancestor.
+    :type items: iterable of content objects or catalog brains
+    :param interface: [required] Interface that should be provided by the
+        ancestor.
+    :type interface: zope.interface.Interface
+    :returns: The closest matching ancestor of each item, in the order of
+        ``items``, or ``None`` if no ancestor matches.
+    :rtype: list
+    :Example: :ref:`content-get-closest-ancestors-example`
+    """
+    site = portal.get()
+    site_path = site.getPhysicalPath()
+    site_depth = len(site_path)
+
+    paths = [
+        (
+            tuple(item.getPath().split("/"))
+            if ICatalogBrain.providedBy(item)
+            else item.getPhysicalPath()
+        )
+        for item in items
+    ]
+    ancestor_paths = {
+        path[:depth]
+        for path in paths
+        if path[:site_depth] == site_path
+        for depth in range(site_depth + 1, len(path))
+    }
+
+    matches = {}
+    if ancestor_paths:
+        catalog = portal.get_tool("portal_catalog")
+        brains = catalog.unrestrictedSearchResults(
+            path={"query": ["/".join(path) for path in ancestor_paths], "depth": 0},
+            object_provides=interface.__identifier__,
+        )
+        matches = {tuple(brain.getPath().split("/")): brain for brain in brains}
+
+    fallback = site if interface.providedBy(site) else None
+    ancestors: dict[tuple[str, ...], Content] = {}
+    results: list[Content | None] = []
+    for path in paths:
+        if path[:site_depth] != site_path or len(path) == site_depth:
+            results.append(None)
+            continue
+        for depth in range(len(path) - 1, site_depth, -1):
+            ancestor_path = path[:depth]
+            if ancestor_path in matches:
+                if ancestor_path not in ancestors:
+                    brain = matches[ancestor_path]
+                    ancestors[ancestor_path] = brain._unrestrictedGetObject()
+                results.append(ancestors[ancestor_path])
+                break
+        else:
+            results.append(fallback)
+    return results
@@ -1,5 +1,7 @@
 """Exceptions raised by plone.api methods."""
 
+from collections.abc import Callable
+
 
 class PloneApiError(Exception):
     """Base exception class for plone.api errors."""
@@ -13,6 +15,35 @@ class InvalidParameterError(PloneApiError):
     """Raised when a parameter is invalid."""
 
 
+class _LazyInvalidParameterError(InvalidParameterError):
+    """InvalidParameterError adding details to its message on demand.
+
+    Working out the details, like the names to suggest, can be expensive,
+    while code probing for something catches the error without formatting
+    it. ``args[0]`` is the message without the details.
+    """
+
+    def __init__(self, message: str, details: Callable[[], str]):
+        super().__init__(message)
+        self._details: Callable[[], str] | None = details
+        self._message = message
+
+    def __str__(self) -> str:
+        if self._details is not None:
+            details, self._details = self._details, None
+            try:
+                text = details()
+            except Exception:
+                # The site or the database connection may be gone by now.
+                text = ""
+            if text:
+                self._message = f"{self._message}\n{text}"
+        return self._message
+
+    def __reduce__(self):
+        return InvalidParameterError, (str(self),)
+
+
 class CannotGetPortalError(PloneApiError):
     """Raised when the portal object cannot be retrieved.
 
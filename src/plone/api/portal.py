@@ -1,38 +1,94 @@
 """Module that provides various utility methods on the portal level."""
 
+from AccessControl import getSecurityManager
+from Acquisition import aq_base
 from Acquisition import aq_inner
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
 from datetime import date
 from datetime import datetime
 from DateTime.DateTime import DateTime
+from DateTime.interfaces import IDateTime
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr
 from email.utils import parseaddr
+from functools import lru_cache
 from logging import getLogger
+from plone.api.exc import _LazyInvalidParameterError
 from plone.api.exc import CannotGetPortalError
 from plone.api.exc import InvalidParameterError
+from plone.api.exc import MissingParameterError
 from plone.api.types import Content
 from plone.api.types import Request
+from plone.api.validation import at_least_one_of
+from plone.api.validation import mutually_exclusive_parameters
 from plone.api.validation import required_parameters
+from plone.base.i18nl10n import datetime_formatvariables
+from plone.base.i18nl10n import get_formatstring_from_registry
+from plone.base.i18nl10n import monthname_msgid
+from plone.base.i18nl10n import monthname_msgid_abbr
+from plone.base.i18nl10n import name_formatvariables
+from plone.base.i18nl10n import ulocalized_time
+from plone.base.i18nl10n import weekdayname_msgid
+from plone.base.i18nl10n import weekdayname_msgid_abbr
 from plone.base.navigationroot import get_navigation_root_object
+from plone.registry.interfaces import IRecordAddedEvent
+from plone.registry.interfaces import IRecordEvent
+from plone.registry.interfaces import IRecordRemovedEvent
 from plone.registry.interfaces import IRegistry
+from Products.CMFCore.interfaces import IActionSucceededEvent
 from Products.CMFCore.interfaces import ISiteRoot
 from Products.CMFCore.utils import getToolByName
 from Products.CMFPlone.Portal import PloneSite
+from Products.MailHost.MailHost import _mungeHeaders
+from Products.MailHost.MailHost import MailBase
+from Products.PluggableAuthService.interfaces.events import IGroupCreatedEvent
+from Products.PluggableAuthService.interfaces.events import IGroupDeletedEvent
+from Products.PluggableAuthService.interfaces.events import IPrincipalAddedToGroupEvent
+from Products.PluggableAuthService.interfaces.events import IPrincipalCreatedEvent
+from Products.PluggableAuthService.interfaces.events import IPrincipalDeletedEvent
+from Products.PluggableAuthService.interfaces.events import (
+    IPrincipalRemovedFromGroupEvent,
+)
+from Products.PluggableAuthService.interfaces.events import IPropertiesUpdatedEvent
 from Products.statusmessages.interfaces import IStatusMessage
+from Products.ZCatalog.interfaces import ICatalogBrain
 from typing import Any
 from zope.component import ComponentLookupError
+from zope.component import getGlobalSiteManager
+from zope.component import getSiteManager
 from zope.component import getUtilitiesFor
 from zope.component import getUtility
 from zope.component import providedBy
+from zope.component import queryUtility
 from zope.component.hooks import getSite
 from zope.globalrequest import getRequest
+from zope.i18n import interpolate
+from zope.i18n import translate as zope_translate
+from zope.i18n.interfaces import INegotiator
+from zope.i18n.interfaces import ITranslationDomain
+from zope.i18nmessageid import Message
 from zope.interface.interface import InterfaceClass
 from zope.interface.interfaces import IInterface
+from zope.lifecycleevent.interfaces import IObjectModifiedEvent
+from zope.lifecycleevent.interfaces import IObjectMovedEvent
+from zope.schema import getFieldNames
 from zope.schema.interfaces import IVocabularyFactory
+from zope.schema.interfaces import ValidationError
 from zope.schema.vocabulary import SimpleVocabulary
+from zope.sendmail.delivery import MailDataManager
+from zope.sendmail.delivery import QueuedMailDelivery
+from zope.sendmail.mailer import SMTPMailer
 
 import datetime as dtime
 import re
+import smtplib
+import threading
+import time
+import transaction
+import weakref
 
 logger = getLogger("plone.api.portal")
 
@@ -60,6 +116,186 @@ else:
 
 MISSING = object()
 
+# Opt-in cache for the portal object and its tools, see enable_lookup_cache.
+LOOKUP_CACHE_ENABLED = False
+
+
+# Per thread: (site, request, portal, tools) of the last portal lookup.
+_lookup_cache = threading.local()
+_lookup_stats = {"hits": 0, "misses": 0}
+_lookup_stats_lock = threading.Lock()
+
+
+def _count_lookup(hit: bool):
+    """Count a hit or a miss of the portal lookup cache."""
+    with _lookup_stats_lock:
+        _lookup_stats["hits" if hit else "misses"] += 1
+
+
+def _cached_lookup() -> tuple[PloneSite, dict[str, Any]] | None:
+    """Return the cached portal and tools if still valid for site and request."""
+    entry = getattr(_lookup_cache, "entry", None)
+    if entry is None:
+        return None
+    site, request, portal, tools = entry
+    if site is not getSite() or request is not getRequest():
+        return None
+    return portal, tools
+
+
+# Per thread: (site, transaction, registry, values) of the registry records
+# read in the current transaction.
+_registry_cache = threading.local()
+
+
+def _cached_registry() -> tuple[Any, dict[str, Any] | None]:
+    """Return the registry and the record values cached for the transaction.
+
+    The values are ``None`` if the lookup cache is disabled.
+    """
+    if not LOOKUP_CACHE_ENABLED:
+        return getUtility(IRegistry), None
+    site, txn = getSite(), transaction.get()
+    entry = getattr(_registry_cache, "entry", None)
+    if entry is None or entry[0] is not site or entry[1] is not txn:
+        entry = _registry_cache.entry = (site, txn, getUtility(IRegistry), {})
+    return entry[2], entry[3]
+
+
+def _read_record(registry: Any, values: dict[str, Any] | None, name: str) -> Any:
+    """Read a record value through the values cached for the transaction."""
+    if values is None:
+        return registry[name]
+    if name not in values:
+        values[name] = registry[name]
+    return values[name]
+
+
+def _invalidate_registry_cache(event: IRecordEvent):
+    """Forget the cached record values when a record changes."""
+    _registry_cache.entry = None
+
+
+# Trigram index of the record names per registry object, see
+# _suggest_record_names.
+_record_name_indexes: weakref.WeakKeyDictionary[Any, dict[str, set[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _suggest_record_names(registry: Any, name: str) -> list[str]:
+    """Return the names of the records that contain ``name``.
+
+    While the lookup cache is enabled, the candidates come from a trigram
+    index of the record names instead of a scan of all of them.
+    """
+    if not LOOKUP_CACHE_ENABLED or len(name) < 3:
+        return [key for key in registry.records.keys() if name in key]
+
+    index = _record_name_indexes.get(aq_base(registry))
+    if index is None:
+        index = {}
+        for key in registry.records.keys():
+            for start in range(len(key) - 2):
+                index.setdefault(key[start : start + 3], set()).add(key)
+        _record_name_indexes[aq_base(registry)] = index
+
+    matches = sorted(
+        (index.get(name[start : start + 3], ()) for start in range(len(name) - 2)),
+        key=len,
+    )
+    candidates = set(matches[0]).intersection(*matches[1:])
+    # The index may still hold records added in an aborted transaction.
+    return sorted(key for key in candidates if name in key and key in registry.records)
+
+
+def _invalidate_record_name_index(event: IRecordEvent):
+    """Forget the indexed record names when a record is added or removed."""
+    _record_name_indexes.clear()
+
+
+def enable_lookup_cache(enabled: bool = True):
+    """Enable or disable caching of the portal object and its tools.
+
+    When enabled, :func:`~plone.api.portal.get` and
+    :func:`~plone.api.portal.get_tool` remember their results per thread.
+    The results are only reused as long as the current site set by
+    ``setSite`` and the current request stay the same, so each request and
+    each Plone site gets its own lookups. :func:`~plone.api.content.get`
+    keeps the containers it traversed to in the same way, until the
+    transaction ends or an object is moved or removed, and
+    :func:`~plone.api.content.iter_ancestors` the chains of parents in the
+    same way.
+
+    :func:`~plone.api.portal.get_registry_record` and
+    :func:`~plone.api.portal.get_registry_records` remember the values they
+    read until the transaction ends or a registry record is added, removed
+    or modified.
+    The names of the records are indexed for the suggestions of
+    get_registry_record until a record is added or removed.
+    :func:`~plone.api.portal.translate` and
+    :func:`~plone.api.portal.translate_many` keep up to
+    ``TRANSLATION_CACHE_SIZE`` translations into an explicitly given
+    language.
+    :func:`~plone.api.portal.get_localized_times` keeps the compiled
+    formats of dates per language and format.
+    :func:`~plone.api.portal.get_default_language`, and so
+    :func:`~plone.api.portal.get_current_language` and
+    :func:`~plone.api.portal.get_current_languages`, reuse the default
+    language read from the registry in the same way as the registry records.
+
+    :param enabled: Whether the cache should be used.
+    :type enabled: boolean
+    :Example: :ref:`portal-enable-lookup-cache-example`
+    """
+    global LOOKUP_CACHE_ENABLED
+
+    LOOKUP_CACHE_ENABLED = enabled
+    _lookup_cache.entry = None
+    _registry_cache.entry = None
+    _record_name_indexes.clear()
+    with _translation_cache_lock:
+        _translation_cache.clear()
+    _localized_time_formatter.cache_clear()
+
+    # plone.api does not ship ZCML that Plone loads, so the subscribers that
+    # invalidate the caches are registered here while needed.
+    from plone.api import content
+
+    handlers = (
+        (content._invalidate_path_cache, IObjectMovedEvent),
+        (content._invalidate_ancestor_cache, IObjectMovedEvent),
+        (_invalidate_registry_cache, IRecordEvent),
+        (_invalidate_record_name_index, IRecordAddedEvent),
+        (_invalidate_record_name_index, IRecordRemovedEvent),
+    )
+    gsm = getGlobalSiteManager()
+    for handler, event in handlers:
+        gsm.unregisterHandler(handler, (event,))
+        if enabled:
+            gsm.registerHandler(handler, (event,))
+
+
+def get_lookup_cache_stats(reset: bool = False) -> dict[str, int | float]:
+    """Get the hit and miss counters of the portal lookup cache.
+
+    :param reset: Reset the counters after reading them.
+    :type reset: boolean
+    :returns: Number of ``hits`` and ``misses``, and the ``hit_rate``
+    :rtype: dict
+    :Example: :ref:`portal-enable-lookup-cache-example`
+    """
+    with _lookup_stats_lock:
+        hits, misses = _lookup_stats["hits"], _lookup_stats["misses"]
+        if reset:
+            _lookup_stats.update(hits=0, misses=0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
+
 
 def get() -> PloneSite:
     """Get the Plone portal object out of thin air.
@@ -71,10 +307,27 @@ def get() -> PloneSite:
     :rtype: Portal object
     :Example: :ref:`portal-get-example`
     """
+    if LOOKUP_CACHE_ENABLED:
+        cached = _cached_lookup()
+        _count_lookup(cached is not None)
+        if cached is not None:
+            return cached[0]
+    return _find_portal()
+
+
+def _find_portal() -> PloneSite:
+    """Look up the portal object, and cache it while the cache is enabled."""
     closest_site = getSite()
     if closest_site is not None:
         for potential_portal in closest_site.aq_chain:
             if ISiteRoot in providedBy(potential_portal):
+                if LOOKUP_CACHE_ENABLED:
+                    _lookup_cache.entry = (
+                        closest_site,
+                        getRequest(),
+                        potential_portal,
+                        {},
+                    )
                 return potential_portal
 
     raise CannotGetPortalError(
@@ -113,11 +366,18 @@ def get_tool(name: str) -> Any:
         :class:`~plone.api.exc.InvalidParameterError`
     :Example: :ref:`portal-get-tool-example`
     """
+    cached = _cached_lookup() if LOOKUP_CACHE_ENABLED else None
+    if LOOKUP_CACHE_ENABLED:
+        _count_lookup(cached is not None and name in cached[1])
+        if cached is not None and name in cached[1]:
+            return cached[1][name]
+
+    # Don't count the lookup of the portal as another hit or miss.
+    portal = cached[0] if cached is not None else _find_portal()
     try:
-        return getToolByName(get(), name)
+        tool = getToolByName(portal, name)
     except AttributeError:
         # get a list of all tools to display their names in the error msg
-        portal = get()
         tools = []
         for id in portal.objectIds():
             if id.startswith("portal_"):
@@ -129,6 +389,39 @@ def get_tool(name: str) -> Any:
             "{tools}".format(name=name, tools="\n".join(tools)),
         )
 
+    if LOOKUP_CACHE_ENABLED:
+        cached = _cached_lookup()
+        if cached is not None:
+            cached[1][name] = tool
+    return tool
+
+
+def _check_mailhost(portal: PloneSite):
+    """Raise a ValueError when the MailHost of the portal is not configured."""
+    if PRINTINGMAILHOST_ENABLED:
+        return
+
+    from plone.api import content
+
+    ctrlOverview = content.get_view(
+        context=portal,
+        request=portal.REQUEST,
+        name="overview-controlpanel",
+    )
+    if ctrlOverview.mailhost_warning():
+        raise ValueError("MailHost is not configured.")
+
+
+def _default_sender() -> str:
+    """Build the sender address from the portal's mail settings."""
+    from_address = get_registry_record("plone.email_from_address")
+    from_name = get_registry_record("plone.email_from_name")
+    sender = formataddr((from_name, from_address))
+    if parseaddr(sender)[1] != from_address:
+        # formataddr probably got confused by special characters.
+        sender = from_address
+    return sender
+
 
 @required_parameters("recipient", "subject", "body")
 def send_email(
@@ -158,27 +451,12 @@ def send_email(
     :Example: :ref:`portal-send-email-example`
     """
     portal = get()
-
-    if not PRINTINGMAILHOST_ENABLED:
-        from plone.api import content
-
-        ctrlOverview = content.get_view(
-            context=portal,
-            request=portal.REQUEST,
-            name="overview-controlpanel",
-        )
-        if ctrlOverview.mailhost_warning():
-            raise ValueError("MailHost is not configured.")
+    _check_mailhost(portal)
 
     encoding = get_registry_record("plone.email_charset")
 
     if not sender:
-        from_address = get_registry_record("plone.email_from_address")
-        from_name = get_registry_record("plone.email_from_name")
-        sender = formataddr((from_name, from_address))
-        if parseaddr(sender)[1] != from_address:
-            # formataddr probably got confused by special characters.
-            sender = from_address
+        sender = _default_sender()
 
     host = get_tool("MailHost")
     host.send(
@@ -191,6 +469,241 @@ def send_email(
     )
 
 
+# Number of emails send_emails sends over one SMTP connection.
+SEND_EMAILS_CHUNK_SIZE = 100
+
+
+class _BatchMailer(SMTPMailer):
+    """SMTP mailer sending many messages over one connection.
+
+    ``SMTPMailer.send`` connects, does the TLS and login handshake, sends one
+    message and closes the connection. Here the connection is kept open for
+    up to ``SEND_EMAILS_CHUNK_SIZE`` messages, and opened again when the
+    server drops it.
+    """
+
+    # A property of SMTPMailer holding the connection of the thread.
+    connection: Any
+    keep_open = False
+    handshaken = False
+
+    def _close_connection(self):
+        if not self.keep_open:
+            super()._close_connection()
+
+    def send_many(self, messages: list[tuple[str, list, bytes]]):
+        """Send the messages, a chunk per connection.
+
+        A message refused by the server is logged and does not stop the rest
+        of them.
+        """
+        for start in range(0, len(messages), SEND_EMAILS_CHUNK_SIZE):
+            chunk = messages[start : start + SEND_EMAILS_CHUNK_SIZE]
+            self.keep_open = True
+            try:
+                for mfrom, mto, message in chunk:
+                    try:
+                        self._send_one(mfrom, mto, message)
+                    except (
+                        smtplib.SMTPRecipientsRefused,
+                        smtplib.SMTPSenderRefused,
+                        smtplib.SMTPDataError,
+                    ):
+                        logger.exception("Could not send email to %s", ", ".join(mto))
+            finally:
+                self.keep_open = self.handshaken = False
+                self.abort()
+
+    def _send_one(self, mfrom: str, mto: list, message: bytes):
+        if self.handshaken:
+            try:
+                self.connection.sendmail(mfrom, mto, message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                self.connection = None
+                self.handshaken = False
+        # SMTPMailer.send connects when needed and does the handshake. Even
+        # if it raises because the message is refused, the handshake is done.
+        self.handshaken = True
+        self.send(mfrom, mto, message)
+
+
+@required_parameters("messages")
+def send_emails(
+    messages: Iterable[Mapping[str, Any]],
+    immediate: bool = False,
+    spool_directory: str | None = None,
+) -> int:
+    """Send many emails at once.
+
+    The MailHost configuration, the charset and the default sender are
+    looked up once for all messages. The messages are sent when the
+    transaction is committed, or right away when ``immediate`` is set, with
+    one SMTP connection per ``SEND_EMAILS_CHUNK_SIZE`` messages.
+
+    :param messages: [required] The emails to send. Each email is a mapping
+        with the keys ``recipient``, ``subject`` and ``body`` and an optional
+        ``sender``, like the parameters of :func:`send_email`.
+    :type messages: iterable of dicts
+    :param immediate: Send immediate instead of at transaction commit time.
+    :type immediate: boolean
+    :param spool_directory: Path of a maildir, created when missing, to write
+        the emails to at transaction commit time instead of sending them. The
+        spool can be delivered later with the ``zope-sendmail`` queue
+        processor, for example to a stand-in SMTP server in tests.
+    :type spool_directory: string
+    :returns: Number of emails queued for sending. Emails refused by the
+        mail server later on are only logged.
+    :rtype: int
+    :raises:
+        ValueError,
+        MissingParameterError
+    :Example: :ref:`portal-send-emails-example`
+    """
+    portal = get()
+    _check_mailhost(portal)
+
+    encoding = get_registry_record("plone.email_charset")
+    default_sender = None
+
+    batch = []
+    for index, message in enumerate(messages):
+        missing = [
+            key for key in ("recipient", "subject", "body") if not message.get(key)
+        ]
+        if missing:
+            raise MissingParameterError(
+                "Missing required parameter(s) {} in message {}.".format(
+                    ", ".join(missing),
+                    index,
+                ),
+            )
+        sender = message.get("sender")
+        if not sender:
+            if default_sender is None:
+                default_sender = _default_sender()
+            sender = default_sender
+        msg, mto, mfrom = _mungeHeaders(
+            message["body"],
+            message["recipient"],
+            sender,
+            subject=message["subject"],
+            charset=encoding,
+        )
+        batch.append((mfrom, list(mto), msg))
+
+    if not batch:
+        return 0
+
+    host = get_tool("MailHost")
+    if spool_directory is not None:
+        delivery = QueuedMailDelivery(spool_directory)
+        for mfrom, mto, msg in batch:
+            delivery.send(mfrom, mto, msg)
+    elif (
+        PRINTINGMAILHOST_ENABLED
+        or getattr(host, "smtp_queue", False)
+        or getattr(type(aq_base(host)), "_send", None) is not MailBase._send
+    ):
+        # Queued, printing and custom mail hosts handle the delivery.
+        for mfrom, mto, msg in batch:
+            host._send(mfrom, mto, msg, immediate=immediate)
+    else:
+        mailer = _BatchMailer(
+            hostname=host.smtp_host,
+            port=int(host.smtp_port),
+            username=host.smtp_uid or None,
+            password=host.smtp_pwd or None,
+            force_tls=host.force_tls,
+            implicit_tls=host.implicit_tls,
+        )
+        if immediate:
+            mailer.send_many(batch)
+        else:
+            transaction.get().join(
+                MailDataManager(
+                    mailer.send_many,
+                    args=(batch,),
+                    vote=lambda batch: mailer.vote(None, None, None),
+                    onAbort=mailer.abort,
+                )
+            )
+    return len(batch)
+
+
+# Format strings of ulocalized_time that strftime handles without names.
+_ISO_TIME_FORMATS = {
+    "date_format_long": "%Y-%m-%d %H:%M",
+    "date_format_short": "%Y-%m-%d",
+    "time_format": "%H:%M",
+}
+_TIME_FORMAT_VARIABLES = "".join(
+    sorted(datetime_formatvariables | name_formatvariables)
+)
+# strftime formats, and the ${X} elements of translated formats.
+_STRFTIME_FORMAT = re.compile(rf"%[{_TIME_FORMAT_VARIABLES}]")
+_TIME_FORMAT_ELEMENT = re.compile(rf"(?<!\$)\$\{{([{_TIME_FORMAT_VARIABLES}])\}}")
+_TIME_FORMAT_NAMES = {
+    "a": weekdayname_msgid_abbr,
+    "A": weekdayname_msgid,
+    "b": monthname_msgid_abbr,
+    "B": monthname_msgid,
+}
+
+
+@lru_cache(maxsize=128)
+def _localized_time_formatter(
+    domain: str,
+    lang: str,
+    msgid: str,
+    formatstring: str | None,
+) -> Callable[[DateTime], str]:
+    """Compile the format of ``ulocalized_time`` for a language.
+
+    The format string and the names of months and weekdays are translated
+    once, so formatting a date only has to fill in the format string.
+    """
+    if formatstring is not None and _STRFTIME_FORMAT.search(formatstring):
+        return lambda time: time.strftime(formatstring)
+    if formatstring is None:
+        formatstring = zope_translate(msgid, domain, target_language=lang)
+    if formatstring == msgid:
+        iso_format = _ISO_TIME_FORMATS.get(msgid, "[INTERNAL ERROR]")
+        return lambda time: time.strftime(iso_format)
+
+    template = zope_translate(formatstring, domain, target_language=lang)
+    elements = set(_TIME_FORMAT_ELEMENT.findall(formatstring))
+    time_elements = elements & datetime_formatvariables
+    name_elements = elements & name_formatvariables
+    translated_names: dict[tuple[str, int], str] = {}
+
+    def translate_name(key, number):
+        if (key, number) not in translated_names:
+            name = _TIME_FORMAT_NAMES[key](number)
+            translated_names[key, number] = zope_translate(
+                name, domain, default=name, target_language=lang
+            )
+        return translated_names[key, number]
+
+    def format_time(time):
+        mapping = {key: time.strftime("%" + key) for key in time_elements}
+        for key in name_elements:
+            # weekday, sunday = 0, or month, january = 1
+            number = int(time.strftime("%w" if key in "aA" else "%m"))
+            mapping[key] = translate_name(key, number)
+        return interpolate(template, mapping) if mapping else template
+
+    return format_time
+
+
+def _negotiate_language(domain: str, request: Request | None) -> str | None:
+    """Return the language zope.i18n negotiates for the domain."""
+    util = queryUtility(ITranslationDomain, domain)
+    if request is None or not hasattr(util, "getCatalogsInfo"):
+        return None
+    return getUtility(INegotiator).getLanguage(util.getCatalogsInfo().keys(), request)
+
+
 @required_parameters("datetime")
 def get_localized_time(
     datetime: date | DateTime | datetime,
@@ -224,23 +737,99 @@ def get_localized_time(
         ValueError
     :Example: :ref:`portal-get-localized-time-example`
     """
+    return get_localized_times([datetime], long_format, time_only)[0]
+
+
+@required_parameters("values")
+def get_localized_times(
+    values: Iterable[date | DateTime | datetime],
+    long_format: bool = False,
+    time_only: bool = False,
+) -> list[str | None]:
+    """Display many dates/times in a user-friendly way.
+
+    This formats the values like :func:`~plone.api.portal.get_localized_time`,
+    but the language, the format and the names of months and weekdays are
+    looked up only once for all of them. While the lookup cache of
+    :func:`~plone.api.portal.enable_lookup_cache` is enabled, the compiled
+    formats are kept per language and format.
+
+    :param values: [required] Dates/times to show.
+    :type values: iterable of DateTime, datetime or date
+    :param long_format: When true, show long date format. When false
+        (default), show the short date format.
+    :type long_format: boolean
+    :param time_only: When true, show only the time, when false
+        (default), show the date.
+    :type time_only: boolean
+    :returns: Localized times, in the order of ``values``, with ``None`` for
+        values that are not dates
+    :rtype: list
+    :Example: :ref:`portal-get-localized-times-example`
+    """
     tool = get_tool(name="translation_service")
     request = getRequest()
+    domain = "plonelocales"
+    lang = _negotiate_language(domain, request)
+    formatters: dict[tuple, Callable[[DateTime], str] | None] = {}
+
+    def get_formatter(long_format, time_only):
+        if (long_format, time_only) in formatters:
+            return formatters[long_format, time_only]
+        formatter = None
+        if lang is not None:
+            if time_only:
+                msgid = "time_format"
+            elif long_format:
+                msgid = "date_format_long"
+            else:
+                msgid = "date_format_short"
+            if long_format and isinstance(long_format, str):
+                formatstring = long_format
+            else:
+                formatstring = get_formatstring_from_registry(msgid)
+            compile = _localized_time_formatter
+            if not LOOKUP_CACHE_ENABLED:
+                compile = compile.__wrapped__
+            formatter = compile(domain, lang, msgid, formatstring)
+        formatters[long_format, time_only] = formatter
+        return formatter
+
+    results: list[str | None] = []
+    for value in values:
+        value_long_format = long_format
+        # isinstance won't work because of date -> datetime inheritance
+        if type(value) is dtime.date:
+            if time_only:
+                results.append("")
+                continue
+            value = dtime.datetime(value.year, value.month, value.day)
+            value_long_format = False
+
+        formatter = get_formatter(value_long_format, time_only)
+        if formatter is None:
+            # Without a negotiated language, leave it to ulocalized_time.
+            results.append(
+                ulocalized_time(
+                    value,
+                    value_long_format,
+                    time_only,
+                    context=tool,
+                    domain=domain,
+                    request=request,
+                )
+            )
+            continue
 
-    # isinstance won't work because of date -> datetime inheritance
-    if type(datetime) is dtime.date:
-        if time_only:
-            return ""
-        datetime = dtime.datetime(datetime.year, datetime.month, datetime.day)
-        long_format = False
-
-    return tool.ulocalized_time(
-        datetime,
-        long_format,
-        time_only,
-        domain="plonelocales",
-        request=request,
-    )
+        if not IDateTime.providedBy(value):
+            try:
+                value = DateTime(value)
+            except Exception:
+                logger.debug(f"Failed to convert {value} to a DateTime object")
+                results.append(None)
+                continue
+        results.append(formatter(value))
+    return results
 
 
 @required_parameters("message")
@@ -293,13 +882,16 @@ def get_registry_record(
             "The interface parameter has to derive from " "zope.interface.Interface",
         )
 
-    registry = getUtility(IRegistry)
+    registry, values = _cached_registry()
 
     if interface is not None:
+        full_name = f"{interface.__identifier__}.{name}"
+        if values is not None and full_name in values and name in interface:
+            return values[full_name]
         records = registry.forInterface(interface, check=False)
         _marker = object()
         if getattr(records, name, _marker) != _marker:
-            return registry[f"{interface.__identifier__}.{name}"]
+            return _read_record(registry, values, full_name)
 
         if default is not MISSING:
             return default
@@ -318,23 +910,132 @@ def get_registry_record(
         )
         raise InvalidParameterError(msg)
 
+    if values is not None and name in values:
+        return values[name]
+
     if name in registry:
-        return registry[name]
+        return _read_record(registry, values, name)
 
     if default is not MISSING:
         return default
 
+    def suggestions():
+        # Code probing for optional records catches the error without
+        # formatting it, so it does not pay for the suggestions.
+        # We don't dump the whole list, because it 1500+ items.
+        records = _suggest_record_names(registry, name)
+        if not records:
+            return ""
+        return "Did you mean?:\n{records}".format(records="\n".join(records))
+
     # Show all records that 'look like' name.
-    # We don't dump the whole list, because it 1500+ items.
-    msg = f"Cannot find a record with name '{name}'"
-    records = [key for key in registry.records.keys() if name in key]
-    if records:
-        msg = (
-            "{message}\n"
-            "Did you mean?:\n"
-            "{records}".format(message=msg, records="\n".join(records))
+    raise _LazyInvalidParameterError(
+        f"Cannot find a record with name '{name}'", suggestions
+    )
+
+
+@required_parameters("name")
+def has_registry_record(
+    name: str,
+    interface: InterfaceClass | None = None,
+) -> bool:
+    """Check if a record exists in ``plone.app.registry``.
+
+    :param name: [required] Name
+    :type name: string
+    :param interface: interface whose attributes are plone.app.registry
+        settings
+    :type interface: zope.interface.Interface
+    :returns: True if the record exists
+    :rtype: bool
+    :Example: :ref:`portal-has-registry-record-example`
+    """
+    if not isinstance(name, str):
+        raise InvalidParameterError("The 'name' parameter has to be a string")
+
+    if interface is not None and not IInterface.providedBy(interface):
+        raise InvalidParameterError(
+            "The interface parameter has to derive from " "zope.interface.Interface",
         )
-    raise InvalidParameterError(msg)
+
+    registry, values = _cached_registry()
+    if interface is not None:
+        if name not in interface:
+            return False
+        name = f"{interface.__identifier__}.{name}"
+    return (values is not None and name in values) or name in registry
+
+
+@mutually_exclusive_parameters("names", "prefix", "interface")
+@at_least_one_of("names", "prefix", "interface")
+def get_registry_records(
+    names: Iterable[str] | None = None,
+    prefix: str | None = None,
+    interface: InterfaceClass | None = None,
+    default: Any = MISSING,
+) -> dict[str, Any]:
+    """Get many record values from ``plone.app.registry`` at once.
+
+    The registry is looked up only once for all records.
+
+    :param names: Full names of the records.
+    :type names: iterable of strings
+    :param prefix: Get all records whose name starts with the prefix.
+    :type prefix: string
+    :param interface: Get all records of the fields of this interface.
+    :type interface: zope.interface.Interface
+    :param default: The value used for records that are not found. Without
+        it, a missing record of ``names`` or ``interface`` raises an error.
+    :type default: anything
+    :returns: Record values by name, or by field name for ``interface``
+    :rtype: dict
+    :raises:
+        :class:`~plone.api.exc.MissingParameterError`,
+        :class:`~plone.api.exc.InvalidParameterError`
+    :Example: :ref:`portal-get-registry-records-example`
+    """
+    if interface is not None and not IInterface.providedBy(interface):
+        raise InvalidParameterError(
+            "The interface parameter has to derive from " "zope.interface.Interface",
+        )
+    if isinstance(names, str):
+        raise InvalidParameterError("The 'names' parameter has to be a list")
+
+    registry, values = _cached_registry()
+
+    if prefix is not None:
+        # Record names are the keys of a BTree, read the range of the prefix.
+        return {
+            name: _read_record(registry, values, name)
+            for name in registry.records.keys(min=prefix, max=prefix + "\U0010ffff")
+            if name.startswith(prefix)
+        }
+
+    if interface is not None:
+        full_names = {
+            f"{interface.__identifier__}.{name}": name
+            for name in getFieldNames(interface)
+        }
+    else:
+        assert names is not None
+        full_names = {name: name for name in names}
+
+    records = {}
+    missing = []
+    for full_name, name in full_names.items():
+        if (values is not None and full_name in values) or full_name in registry:
+            records[name] = _read_record(registry, values, full_name)
+        elif default is not MISSING:
+            records[name] = default
+        else:
+            missing.append(full_name)
+
+    if missing:
+        raise InvalidParameterError(
+            "Cannot find records with names:\n"
+            "{names}".format(names="\n".join(missing)),
+        )
+    return records
 
 
 @required_parameters("name", "value")
@@ -394,6 +1095,71 @@ def set_registry_record(
         registry[name] = value
 
 
+@required_parameters("records")
+def set_registry_records(
+    records: Mapping[str, Any],
+    interface: InterfaceClass | None = None,
+):
+    """Set many record values in the ``plone.app.registry`` at once.
+
+    All values are validated against the fields of their records before
+    any of them is written, so either all records are set or none.
+
+    :param records: [required] Values to set by name of the record, or by
+        field name if ``interface`` is given
+    :type records: dict
+    :param interface: interface whose attributes are plone.app.registry
+        settings
+    :type interface: zope.interface.Interface
+    :raises:
+        :class:`~plone.api.exc.MissingParameterError`,
+        :class:`~plone.api.exc.InvalidParameterError`
+    :Example: :ref:`portal-set-registry-records-example`
+    """
+    if not isinstance(records, Mapping):
+        raise InvalidParameterError("The 'records' parameter has to be a mapping")
+
+    if interface is not None and not IInterface.providedBy(interface):
+        raise InvalidParameterError(
+            "The interface parameter has to derive from " "zope.interface.Interface",
+        )
+
+    registry = getUtility(IRegistry)
+
+    changes = []
+    errors = []
+    for name, value in records.items():
+        if interface is None:
+            record = registry.records.get(name)
+        elif name in interface:
+            record = registry.records.get(f"{interface.__identifier__}.{name}")
+        else:
+            record = None
+        if record is None:
+            errors.append(f"{name}: Cannot find a record with this name")
+            continue
+
+        field = record.field.bind(record)
+        if value != field.missing_value:
+            try:
+                field.validate(value)
+            except ValidationError as error:
+                errors.append(f"{name}: {error.doc()}")
+                continue
+        changes.append((record, value))
+
+    if errors:
+        raise InvalidParameterError(
+            "Cannot set the registry records:\n"
+            "{errors}".format(
+                errors="\n".join(errors),
+            ),
+        )
+
+    for record, value in changes:
+        record.value = value
+
+
 def get_default_language() -> str:
     """Return the default language.
 
@@ -401,11 +1167,10 @@ def get_default_language() -> str:
     :rtype: string
     :Example: :ref:`portal-get-default-language-example`
     """
-    from plone.i18n.interfaces import ILanguageSchema
-
-    registry = getUtility(IRegistry)
-    settings = registry.forInterface(ILanguageSchema, prefix="plone")
-    return settings.default_language
+    # Read the record directly instead of building a records proxy for
+    # ILanguageSchema on every call.
+    registry, values = _cached_registry()
+    return _read_record(registry, values, "plone.default_language")
 
 
 def get_current_language(context: Content | None = None) -> str:
@@ -425,6 +1190,134 @@ def get_current_language(context: Content | None = None) -> str:
     )
 
 
+@required_parameters("contexts")
+def get_current_languages(
+    contexts: Iterable[Content | ICatalogBrain],
+) -> list[str]:
+    """Return the current negotiated language for many contexts.
+
+    This resolves the language like
+    :func:`~plone.api.portal.get_current_language`, but the request and
+    the default language are looked up only once for all contexts. Catalog
+    brains are resolved from their ``Language`` metadata without loading
+    the objects, if the catalog has such a metadata column.
+
+    :param contexts: [required] Content objects or catalog brains.
+    :type contexts: iterable
+    :returns: Language identifiers, in the order of ``contexts``
+    :rtype: list
+    :Example: :ref:`portal-get-current-languages-example`
+    """
+    request = getRequest()
+    language = request.get("LANGUAGE", None) if request is not None else None
+    if language:
+        return [language for context in contexts]
+
+    default_language = None
+    languages = []
+    for context in contexts:
+        if ICatalogBrain.providedBy(context):
+            if "Language" in context.__record_schema__:
+                language = context.Language
+            else:
+                language = context.getObject().Language()
+        else:
+            language = context and aq_inner(context).Language()
+        if not language:
+            if default_language is None:
+                default_language = get_default_language()
+            language = default_language
+        languages.append(language)
+    return languages
+
+
+# Translations by the key of _translation_key, least recently used first.
+TRANSLATION_CACHE_SIZE = 1000
+_translation_cache: OrderedDict[tuple, str] = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+
+def _translation_key(msgid: str, domain: str, lang: str | None) -> tuple | None:
+    """Return the cache key of a translation, or None if it can't be cached.
+
+    A message uses its own domain, mapping and defaults. The translation
+    domain utility and its number of catalogs are part of the key, so
+    registering a domain or adding catalogs to it invalidates the entries.
+    """
+    if isinstance(msgid, Message):
+        domain = msgid.domain
+        mapping = msgid.mapping
+        message = (
+            msgid.default,
+            msgid.msgid_plural,
+            msgid.default_plural,
+            msgid.number,
+        )
+    else:
+        mapping = None
+        message = None
+    util = queryUtility(ITranslationDomain, domain) if domain else None
+    key = (
+        util,
+        len(getattr(util, "_data", ())),
+        domain,
+        str(msgid),
+        message,
+        tuple(sorted(mapping.items())) if mapping else None,
+        lang,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _translate(
+    translation_service: Any,
+    msgid: str,
+    domain: str,
+    lang: str | None,
+) -> str:
+    """Translate with the translation cache while the lookup cache is on.
+
+    Without a target language the language is negotiated from the request,
+    so those translations are not cached.
+    """
+    key = None
+    if LOOKUP_CACHE_ENABLED and lang is not None:
+        key = _translation_key(msgid, domain, lang)
+    if key is not None:
+        with _translation_cache_lock:
+            if key in _translation_cache:
+                _translation_cache.move_to_end(key)
+                return _translation_cache[key]
+
+    query = {
+        "msgid": msgid,
+        "domain": domain,
+        "target_language": lang,
+    }
+    if lang is None:
+        # Pass the request, so zope.i18n.translate can negotiate the language.
+        query["context"] = getRequest()
+    translation = translation_service.utranslate(**query)
+
+    if key is not None:
+        with _translation_cache_lock:
+            _translation_cache[key] = translation
+            if len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+                _translation_cache.popitem(last=False)
+    return translation
+
+
+def _normalize_language(lang: str | None) -> str | None:
+    """Turn language codes like ``pt-br`` into ``pt_BR``."""
+    if lang and re.match(r"\D{2}-\D{2}", lang):
+        lang = f"{lang[:2]}_{lang[-2:].upper()}"
+    return lang
+
+
 def translate(msgid: str, domain: str = "plone", lang: str | None = None) -> str:
     """Translate a message into a given language.
 
@@ -443,17 +1336,130 @@ def translate(msgid: str, domain: str = "plone", lang: str | None = None) -> str
     :Example: :ref:`portal-translate-example`
     """
     translation_service = get_tool("translation_service")
-    if lang and re.match(r"\D{2}-\D{2}", lang):
-        lang = f"{lang[:2]}_{lang[-2:].upper()}"
-    query = {
-        "msgid": msgid,
-        "domain": domain,
-        "target_language": lang,
-    }
-    if lang is None:
-        # Pass the request, so zope.i18n.translate can negotiate the language.
-        query["context"] = getRequest()
-    return translation_service.utranslate(**query)
+    return _translate(translation_service, msgid, domain, _normalize_language(lang))
+
+
+@required_parameters("msgids")
+def translate_many(
+    msgids: Iterable[str],
+    domain: str = "plone",
+    lang: str | None = None,
+) -> list[str]:
+    """Translate many messages into a given language.
+
+    The translation service and the target language are looked up once for
+    all messages, and each distinct message is translated once. Messages
+    with the same text but another domain or mapping are distinct.
+
+    :param msgids: [required] messages to translate
+    :type msgids: iterable of strings or zope.i18nmessageid.Message
+    :param domain: i18n domain to use for messages that are not an instance
+        of ``Message``.
+    :type domain: string
+    :param lang: target language, defaults to the negotiated language
+    :type lang: string
+    :returns: translated messages, in the order of ``msgids``
+    :rtype: list
+    :Example: :ref:`portal-translate-many-example`
+    """
+    if isinstance(msgids, str):
+        raise InvalidParameterError("The 'msgids' parameter has to be a list")
+
+    translation_service = get_tool("translation_service")
+    lang = _normalize_language(lang)
+    translations: dict[tuple, str] = {}
+    results = []
+    for msgid in msgids:
+        # Messages compare equal to their text, so compare the keys instead.
+        key = _translation_key(msgid, domain, lang)
+        if key is None:
+            results.append(_translate(translation_service, msgid, domain, lang))
+            continue
+        if key not in translations:
+            translations[key] = _translate(translation_service, msgid, domain, lang)
+        results.append(translations[key])
+    return results
+
+
+# Opt-in cache of vocabularies, see enable_vocabulary_cache. Entries are
+# (expiry time, vocabulary) by _vocabulary_cache_key, least recently used first.
+VOCABULARY_CACHE_TTL: float = 0
+VOCABULARY_CACHE_SIZE = 1000
+_vocabulary_cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+_vocabulary_cache_lock = threading.Lock()
+
+# Events after which cached vocabularies may be outdated.
+_VOCABULARY_CACHE_EVENTS = (
+    IObjectModifiedEvent,
+    IObjectMovedEvent,
+    IActionSucceededEvent,
+    IRecordEvent,
+    IPrincipalCreatedEvent,
+    IPrincipalDeletedEvent,
+    IPropertiesUpdatedEvent,
+    IPrincipalAddedToGroupEvent,
+    IPrincipalRemovedFromGroupEvent,
+    IGroupCreatedEvent,
+    IGroupDeletedEvent,
+)
+
+
+def _vocabulary_cache_key(name: str, context: Content) -> tuple | None:
+    """Return the cache key of a vocabulary, or None if it can't be cached.
+
+    Vocabularies often depend on what the user may see, so the user is part
+    of the key as well.
+    """
+    if getRequest() is None or not hasattr(aq_base(context), "getPhysicalPath"):
+        return None
+    return (
+        name,
+        context.getPhysicalPath(),
+        get_current_language(context),
+        getSecurityManager().getUser().getId(),
+    )
+
+
+def _invalidate_vocabulary_cache(event: Any = None):
+    """Forget all cached vocabularies."""
+    with _vocabulary_cache_lock:
+        _vocabulary_cache.clear()
+
+
+def enable_vocabulary_cache(enabled: bool = True, ttl: float = 60):
+    """Enable or disable caching of vocabularies.
+
+    When enabled, :func:`~plone.api.portal.get_vocabulary` keeps the
+    vocabularies it created for ``ttl`` seconds, per name, context, language
+    and user. Only plain ``SimpleVocabulary`` instances, which hold all of
+    their terms, are kept; sources and vocabularies that look up their
+    terms lazily are not.
+
+    The cache is cleared whenever content is added, modified, moved,
+    removed or transitioned, a registry record changes, or users and
+    groups change in this process. Changes made by other processes are
+    seen once the cached vocabularies expire.
+
+    :param enabled: Whether the cache should be used.
+    :type enabled: boolean
+    :param ttl: Number of seconds a vocabulary is kept.
+    :type ttl: float
+    :Example: :ref:`portal-enable-vocabulary-cache-example`
+    """
+    global VOCABULARY_CACHE_TTL
+
+    if enabled and ttl <= 0:
+        raise InvalidParameterError("The 'ttl' parameter has to be positive")
+
+    VOCABULARY_CACHE_TTL = ttl if enabled else 0
+    _invalidate_vocabulary_cache()
+
+    # Like the registry caches, the subscribers are registered while needed.
+    gsm = getGlobalSiteManager()
+    for event in _VOCABULARY_CACHE_EVENTS:
+        gsm.unregisterHandler(_invalidate_vocabulary_cache, (event,))
+        if enabled:
+            gsm.registerHandler(_invalidate_vocabulary_cache, (event,))
 
 
 @required_parameters("name")
@@ -470,6 +1476,17 @@ def get_vocabulary(name: str, context: Content | None = None) -> SimpleVocabular
     """
     if context is None:
         context = get()
+
+    key = None
+    if VOCABULARY_CACHE_TTL > 0:
+        key = _vocabulary_cache_key(name, context)
+    if key is not None:
+        with _vocabulary_cache_lock:
+            entry = _vocabulary_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                _vocabulary_cache.move_to_end(key)
+                return entry[1]
+
     try:
         vocabulary = getUtility(IVocabularyFactory, name)
     except ComponentLookupError:
@@ -481,7 +1498,21 @@ def get_vocabulary(name: str, context: Content | None = None) -> SimpleVocabular
                 vocabularies="\n".join(get_vocabulary_names()),
             ),
         )
-    return vocabulary(context)
+    vocabulary = vocabulary(context)
+
+    if key is not None and type(vocabulary) is SimpleVocabulary:
+        with _vocabulary_cache_lock:
+            _vocabulary_cache[key] = (
+                time.monotonic() + VOCABULARY_CACHE_TTL,
+                vocabulary,
+            )
+            if len(_vocabulary_cache) > VOCABULARY_CACHE_SIZE:
+                _vocabulary_cache.popitem(last=False)
+    return vocabulary
+
+
+# Per thread: (site manager, generations of its utility registries, names).
+_vocabulary_names_cache = threading.local()
 
 
 def get_vocabulary_names() -> list[str]:
@@ -491,4 +1522,15 @@ def get_vocabulary_names() -> list[str]:
     :rtype: list[str]
     :Example: :ref:`portal-get-all-vocabulary-names-example`
     """
-    return sorted([name for name, vocabulary in getUtilitiesFor(IVocabularyFactory)])
+    # Registering or unregistering a utility in any registry of the site
+    # manager bumps its generation, like zope.interface's own lookup caches
+    # rely on.
+    sm = getSiteManager()
+    generations = tuple(registry._generation for registry in sm.utilities.ro)
+    entry = getattr(_vocabulary_names_cache, "entry", None)
+    if entry is None or entry[0] is not sm or entry[1] != generations:
+        names = sorted(
+            [name for name, vocabulary in getUtilitiesFor(IVocabularyFactory)]
+        )
+        entry = _vocabulary_names_cache.entry = (sm, generations, names)
+    return list(entry[2])
@@ -5,6 +5,9 @@ Heavily inspired by collective.relationhelpers.
 
 from AccessControl.SecurityManagement import getSecurityManager
 from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Iterator
+from functools import lru_cache
 from importlib.metadata import distribution
 from importlib.metadata import PackageNotFoundError
 from plone.api.exc import InvalidParameterError
@@ -16,6 +19,7 @@ from plone.app.linkintegrity.utils import referencedRelationship
 from plone.base.utils import base_hasattr
 from plone.dexterity.utils import iterSchemataForType
 from plone.supermodel.model import SchemaClass
+from Products.CMFCore.utils import getToolByName
 from typing import DefaultDict
 from z3c.relationfield import event
 from z3c.relationfield import RelationValue
@@ -24,6 +28,7 @@ from z3c.relationfield.schema import RelationChoice
 from z3c.relationfield.schema import RelationList
 from zc.relation.interfaces import ICatalog
 from zope.component import getUtility
+from zope.component import queryUtility
 from zope.intid.interfaces import IIntIds
 from zope.lifecycleevent import modified
 from zope.schema._bootstrapfields import Field
@@ -351,3 +356,77 @@ def delete(
             modified(source)
         # unindex in case something went wrong with the automatic unindex
         relation_catalog.unindex(rel)
+
+
+@required_parameters("objects")
+def iter_breaches(
+    objects: Iterable[Content],
+) -> Iterator[z3c.relationfield.relation.RelationValue]:
+    """Iterate over the relations that would break when deleting objects.
+
+    These are the relations pointing into the objects, or to anything
+    inside them, from outside of them. They are found with the ``to_id``
+    and ``from_id`` indexes of the relation catalog. When the objects
+    contain fewer items than there are relation targets in the site, only
+    the intids of the contained items are looked up. Otherwise only the
+    relation targets and the sources of relations into the objects are
+    loaded.
+
+    :param objects: [required] Objects that we want to delete.
+    :type objects: iterable of content objects
+    :returns: Iterator of the relations, unrestricted and including links
+        found by link integrity.
+    :rtype: iterator of RelationValue objects
+    :Example: :ref:`relation-iter-breaches-example`
+    """
+    relation_catalog = queryUtility(ICatalog)
+    if relation_catalog is None:
+        return
+    intids = getUtility(IIntIds)
+
+    objects = list(objects)
+    paths = ["/".join(obj.getPhysicalPath()) for obj in objects]
+    if not paths:
+        return
+
+    targets = relation_catalog.findValueTokens("to_id")
+    catalog = getToolByName(objects[0], "portal_catalog")
+    brains = catalog.unrestrictedSearchResults(path=paths)
+
+    if len(brains) < len(targets):
+        # Few items to delete: look up all their intids.
+        contained = {intids.queryId(obj) for obj in objects}
+        for brain in brains:
+            try:
+                contained.add(intids.queryId(brain._unrestrictedGetObject()))
+            except (AttributeError, KeyError):
+                continue
+        contained.discard(None)
+        is_contained = contained.__contains__
+        candidates = (token for token in contained if token in targets)
+    else:
+        # Many items to delete: check the path of each relation target.
+        def _is_contained(token: int) -> bool:
+            obj = intids.queryObject(token)
+            if obj is None:
+                # A broken relation, deleting cannot break it any further.
+                # Broken targets are no candidates, and the relations from
+                # broken sources are skipped below.
+                return False
+            path = "/".join(obj.getPhysicalPath())
+            return any(
+                path == parent_path or path.startswith(f"{parent_path}/")
+                for parent_path in paths
+            )
+
+        is_contained = lru_cache(maxsize=None)(_is_contained)
+        candidates = (token for token in targets if is_contained(token))
+
+    for token in candidates:
+        for relation_token in relation_catalog.findRelationTokens({"to_id": token}):
+            sources = relation_catalog.getValueTokens("from_id", relation_token)
+            if any(
+                not is_contained(source) and intids.queryObject(source) is not None
+                for source in sources or ()
+            ):
+                yield relation_catalog.resolveRelationToken(relation_token)
@@ -7,6 +7,7 @@ from OFS.interfaces import IObjectWillBeMovedEvent
 from plone import api
 from plone.api.content import _parse_object_provides_query
 from plone.api.exc import MissingParameterError
+from plone.api.tests.base import FUNCTIONAL_TESTING
 from plone.api.tests.base import INTEGRATION_TESTING
 from plone.api.types import Content
 from plone.app.contenttypes.interfaces import IFolder
@@ -26,11 +27,14 @@ from zope.component import getGlobalSiteManager
 from zope.component import getUtility
 from zope.container.contained import ContainerModifiedEvent
 from zope.interface import alsoProvides
+from zope.interface import Interface
 from zope.lifecycleevent import IObjectModifiedEvent
 from zope.lifecycleevent import IObjectMovedEvent
 from zope.lifecycleevent import modified
 from zope.lifecycleevent import ObjectMovedEvent
 
+import pickle
+import transaction
 import unittest
 
 
@@ -437,6 +441,121 @@ class TestPloneApiContent(unittest.TestCase):
         self.assertEqual(results[0].start, today)
         self.assertEqual(results[0].end, tomorrow)
 
+    def test_create_many_constraints(self):
+        """Test the constraints when creating many content items."""
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.create_many(items=[])
+
+        with self.assertRaises(MissingParameterError):
+            api.content.create_many(container=self.portal)
+
+        with self.assertRaises(InvalidParameterError):
+            list(
+                api.content.create_many(
+                    container=self.portal,
+                    items=[],
+                    batch_size=0,
+                )
+            )
+
+        # Every item needs a type
+        with self.assertRaises(MissingParameterError):
+            list(
+                api.content.create_many(
+                    container=self.portal,
+                    items=[{"id": "test-document"}],
+                )
+            )
+
+        # Every item needs an id or a title
+        with self.assertRaises(MissingParameterError):
+            list(
+                api.content.create_many(
+                    container=self.portal,
+                    items=[{"type": "Document"}],
+                )
+            )
+
+        # Unknown types are reported like in create()
+        with self.assertRaises(InvalidParameterError):
+            list(
+                api.content.create_many(
+                    container=self.events,
+                    items=[{"type": "foo", "id": "test-foo"}],
+                )
+            )
+
+    def test_create_many(self):
+        """Test creating many content items in one go."""
+        folder = api.content.create(
+            container=self.portal,
+            type="Folder",
+            id="test-folder",
+        )
+        items = [
+            {"type": "Document", "id": "test-document"},
+            {"type": "Document", "title": "Test id generated"},
+            {"type": "Document", "title": "Test id generated"},
+            {"type": "News Item", "title": "Test news", "description": "Hot"},
+        ]
+        created = api.content.create_many(container=folder, items=items)
+
+        # The items are created lazily
+        self.assertNotIn("test-document", folder)
+        created = list(created)
+
+        self.assertListEqual(
+            [obj.id for obj in created],
+            [
+                "test-document",
+                "test-id-generated",
+                "test-id-generated-1",
+                "test-news",
+            ],
+        )
+        self.assertListEqual(
+            [obj.id for obj in created],
+            [folder[obj.id].id for obj in created],
+        )
+        self.assertEqual(created[1].Title(), "Test id generated")
+        self.assertEqual(created[3].portal_type, "News Item")
+        self.assertEqual(created[3].Description(), "Hot")
+        self.assertEqual(len(api.content.find(context=folder, depth=1)), 4)
+
+        # Given ids are enforced unless safe_id is set
+        with self.assertRaises(BadRequest):
+            list(
+                api.content.create_many(
+                    container=folder,
+                    items=[{"type": "Document", "id": "test-document"}],
+                )
+            )
+        created = list(
+            api.content.create_many(
+                container=folder,
+                items=[{"type": "Document", "id": "test-document"}],
+                safe_id=True,
+            )
+        )
+        self.assertEqual(created[0].id, "test-document-1")
+        self.verify_intids()
+
+    def test_create_many_savepoints(self):
+        """Test that a savepoint is made after every batch."""
+        items = [{"type": "Document", "title": f"Page {i}"} for i in range(5)]
+        with mock.patch("plone.api.content.transaction") as transaction:
+            created = list(
+                api.content.create_many(
+                    container=self.portal,
+                    items=items,
+                    batch_size=2,
+                )
+            )
+        self.assertEqual(len(created), 5)
+        self.assertEqual(transaction.savepoint.call_count, 2)
+
     def test_get_constraints(self):
         """Test the constraints when content is fetched with get."""
         # Path and UID parameter can not be given together
@@ -497,6 +616,109 @@ class TestPloneApiContent(unittest.TestCase):
             team_by_uid = api.content.get(UID=self.team.UID())
             self.assertEqual(self.team, team_by_uid)
 
+    def test_get_many_constraints(self):
+        """Test the constraints for getting many objects."""
+        from plone.api.exc import InvalidParameterError
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.get_many()
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.get_many(UIDs=[], paths=[])
+
+    def test_get_many(self):
+        """Test getting many objects by UID or path."""
+        uids = [self.team.UID(), "notfound", self.sprint.UID()]
+        self.assertEqual(
+            api.content.get_many(UIDs=uids),
+            [self.team, None, self.sprint],
+        )
+        self.assertEqual(api.content.get_many(UIDs=[]), [])
+
+        paths = [
+            "/events/sprint",
+            "/".join(self.team.getPhysicalPath()),
+            "/about/missing",
+            "/about/team/getId",
+        ]
+        self.assertEqual(
+            api.content.get_many(paths=iter(paths)),
+            [self.sprint, self.team, None, None],
+        )
+
+    def test_get_paths(self):
+        """Test getting many objects by path with get()."""
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.get(path="/about", paths=["/about"])
+
+        self.assertEqual(
+            api.content.get(paths=["/about/team", "/about/missing", "/events/sprint"]),
+            [self.team, None, self.sprint],
+        )
+        self.assertEqual(api.content.get(paths=[]), [])
+
+    def test_get_path_cache(self):
+        """Test that parents are cached per request with the lookup cache."""
+        from plone.api.content import _path_cache
+
+        api.portal.enable_lookup_cache()
+        self.addCleanup(api.portal.enable_lookup_cache, False)
+
+        self.assertEqual(
+            api.content.get(paths=["/about/team", "/about/contact"]),
+            [self.team, self.contact],
+        )
+        site, request, txn, site_path, parents = _path_cache.entry
+        self.assertIs(site, self.portal)
+        self.assertIs(txn, transaction.get())
+        self.assertEqual(site_path, "/plone")
+        self.assertEqual(sorted(parents), ["/plone", "/plone/about"])
+
+        # The cached parents are used for later lookups in the same request
+        self.assertEqual(api.content.get(path="/about/team"), self.team)
+        self.assertIs(_path_cache.entry[4], parents)
+
+        # Access to the item itself is still checked
+        api.content.transition(obj=self.team, transition="publish")
+        with api.env.adopt_roles(["Anonymous"]):
+            self.assertEqual(
+                api.content.get(paths=["/about/team", "/about/contact"]),
+                [self.team, None],
+            )
+
+        # Without the lookup cache nothing is kept
+        api.portal.enable_lookup_cache(False)
+        self.assertEqual(api.content.get(path="/about/team"), self.team)
+        self.assertIsNone(_path_cache.entry)
+
+    def test_get_path_cache_moved(self):
+        """Test that moved and removed parents are not used from the cache."""
+        api.portal.enable_lookup_cache()
+        self.addCleanup(api.portal.enable_lookup_cache, False)
+
+        self.assertEqual(api.content.get(path="/about/team"), self.team)
+        api.content.rename(obj=self.about, new_id="about-us")
+        self.assertIsNone(api.content.get(path="/about/team"))
+        team = api.content.get(path="/about-us/team")
+        self.assertEqual(team.getPhysicalPath(), ("", "plone", "about-us", "team"))
+
+        api.content.delete(obj=self.portal["about-us"], check_linkintegrity=False)
+        self.assertIsNone(api.content.get(path="/about-us/team"))
+
+    def test_get_many_unrestricted(self):
+        """Test that get_many skips inaccessible objects unless unrestricted."""
+        uids = [self.team.UID(), self.contact.UID()]
+        api.content.transition(obj=self.team, transition="publish")
+        with api.env.adopt_roles(["Anonymous"]):
+            self.assertEqual(api.content.get_many(UIDs=uids), [self.team, None])
+            self.assertEqual(
+                api.content.get_many(UIDs=uids, unrestricted=True),
+                [self.team, self.contact],
+            )
+
     def test_move_constraints(self):
         """Test the constraints for moving content."""
         from plone.api.exc import MissingParameterError
@@ -691,6 +913,205 @@ class TestPloneApiContent(unittest.TestCase):
         assert self.portal["about"].aq_base is about.aq_base
         assert self.portal["about-1"].aq_base is events.aq_base
 
+    def test_move_many_constraints(self):
+        """Test the constraints for moving many objects."""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.move_many(sources=[self.team])
+
+        with self.assertRaises(MissingParameterError):
+            api.content.move_many(target=self.portal)
+
+        self.assertEqual(api.content.move_many(sources=[], target=self.portal), [])
+
+    def test_move_many(self):
+        """Test moving many objects from different containers at once."""
+        container = self.portal
+        api.content.create(container=self.events, type="Document", id="team")
+        sources = [self.sprint, self.contact, self.team, self.events["team"]]
+
+        with mock.patch.object(
+            type(aq_base(self.about)),
+            "manage_cutObjects",
+            autospec=True,
+            side_effect=type(aq_base(self.about)).manage_cutObjects,
+        ) as manage_cutObjects:
+            moved = api.content.move_many(sources=sources, target=container)
+
+        self.assertEqual(manage_cutObjects.call_count, 2)
+        # Sources are pasted grouped by their container, so the team page
+        # of the events folder gets its id first.
+        self.assertEqual(
+            [obj.getId() for obj in moved],
+            ["sprint", "contact", "copy_of_team", "team"],
+        )
+        self.assertEqual(moved[3], container["team"])
+        self.assertEqual(self.about.keys(), [])
+        self.assertEqual(self.events.keys(), ["training", "conference"])
+
+        # Objects already in the target keep their id
+        self.assertDictEqual(
+            api.content.move_many(
+                sources=[container["sprint"], self.training],
+                target=container,
+                as_dict=True,
+            ),
+            {"/plone/sprint": "sprint", "/plone/events/training": "training"},
+        )
+
+    def test_copy_many(self):
+        """Test copying many objects from different containers at once."""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.copy_many(sources=[self.team])
+
+        copied = api.content.copy_many(
+            sources=[self.team, self.sprint, self.contact, self.team],
+            target=self.events,
+        )
+        self.assertEqual(
+            copied,
+            [
+                self.events["team"],
+                self.events["copy_of_sprint"],
+                self.events["contact"],
+            ],
+        )
+        self.assertIn("team", self.about)
+
+        self.assertDictEqual(
+            api.content.copy_many(
+                sources=[self.team, self.blog],
+                target=self.events,
+                as_dict=True,
+            ),
+            {"/plone/about/team": "copy_of_team", "/plone/blog": "blog"},
+        )
+
+    def test_copy_tree_constraints(self):
+        """Test the constraints for copying a tree."""
+        from plone.api.exc import InvalidParameterError
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.copy_tree(source=self.about)
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.copy_tree(source=self.about, target=self.events, batch_size=0)
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.copy_tree(source=self.about, target=self.about)
+
+    def test_copy_tree(self):
+        """Test copying a tree in batches."""
+        subfolder = api.content.create(
+            container=self.about, type="Folder", id="subfolder"
+        )
+        for index in range(3):
+            api.content.create(container=subfolder, type="Document", id=f"page-{index}")
+
+        with mock.patch("plone.api.content.transaction") as transaction:
+            status = api.content.copy_tree(
+                source=self.about,
+                target=self.events,
+                batch_size=2,
+            )
+
+        self.assertEqual(status.state, "done")
+        self.assertTrue(status.done)
+        self.assertTrue(status.wait())
+        self.assertIsNone(status.error)
+        self.assertEqual(status.copy_path, "/plone/events/about")
+        self.assertEqual(status.total, 7)
+        self.assertEqual(status.copied, 7)
+        # One commit after every two objects and one at the end
+        self.assertEqual(transaction.commit.call_count, 4)
+
+        copy = self.events["about"]
+        self.assertEqual(copy.objectIds(), ["team", "contact", "subfolder"])
+        self.assertEqual(copy["subfolder"].objectIds(), ["page-0", "page-1", "page-2"])
+        self.assertNotEqual(copy.UID(), self.about.UID())
+        self.assertNotEqual(copy["team"].UID(), self.team.UID())
+        self.assertEqual(self.about.objectIds(), ["team", "contact", "subfolder"])
+
+        # The copy is catalogued
+        self.assertEqual(
+            len(api.content.find(path="/plone/events/about", portal_type="Document")),
+            5,
+        )
+
+        # Copying again chooses another id
+        with mock.patch("plone.api.content.transaction"):
+            status = api.content.copy_tree(source=self.about, target=self.events)
+        self.assertEqual(status.copy_path, "/plone/events/copy_of_about")
+
+    def test_copy_tree_blobs(self):
+        """Test that blobs of copied folders keep their data."""
+        from plone.namedfile.file import NamedBlobImage
+
+        data = b"GIF89a\x01\x00\x01\x00\x00\x00\x00;image data"
+        self.about.image = NamedBlobImage(data=data, filename="image.gif")
+
+        with mock.patch("plone.api.content.transaction"):
+            api.content.copy_tree(source=self.about, target=self.events)
+
+        copy = self.events["about"]
+        self.assertEqual(copy.image.data, data)
+        self.assertIsNot(copy.image._blob, self.about.image._blob)
+        self.assertEqual(self.about.image.data, data)
+
+    def test_copy_tree_inaccessible_items(self):
+        """Test that items the user cannot view are not dropped silently."""
+        api.user.create(
+            username="siteadmin",
+            email="siteadmin@example.org",
+            roles=["Site Administrator"],
+        )
+        self.contact.manage_permission("View", ["Manager"], acquire=False)
+
+        # Items the user may not view are found while copying
+        with api.env.adopt_user(username="siteadmin"):
+            self.assertFalse(api.user.has_permission("View", obj=self.contact))
+            with mock.patch("plone.api.content.transaction"):
+                with self.assertRaises(CopyError) as cm:
+                    api.content.copy_tree(source=self.about, target=self.events)
+        self.assertIn("/plone/about/contact", str(cm.exception))
+        api.content.delete(self.events["about"])
+
+        # Items the user cannot find are refused before copying anything
+        self.contact.manage_permission(
+            "Access contents information", ["Manager"], acquire=False
+        )
+        self.contact.reindexObjectSecurity()
+        with api.env.adopt_user(username="siteadmin"):
+            with mock.patch("plone.api.content.transaction") as transaction:
+                with self.assertRaises(CopyError) as cm:
+                    api.content.copy_tree(source=self.about, target=self.events)
+        self.assertIn("/plone/about/contact", str(cm.exception))
+        transaction.commit.assert_not_called()
+        self.assertNotIn("about", self.events)
+
+    def test_copy_tree_resume(self):
+        """Test resuming a copy that was interrupted."""
+        with mock.patch("plone.api.content.transaction"):
+            api.content.copy_tree(source=self.about, target=self.portal, id="copy")
+            api.content.delete(self.portal["copy"]["contact"])
+
+            status = api.content.copy_tree(
+                source=self.about,
+                target=self.portal,
+                id="copy",
+                resume=True,
+            )
+
+        self.assertEqual(status.copy_path, "/plone/copy")
+        # The objects copied before resuming are counted as well
+        self.assertEqual(status.copied, 3)
+        self.assertEqual(status.copied, status.total)
+        self.assertEqual(self.portal["copy"].objectIds(), ["team", "contact"])
+
     def test_copy_constraints(self):
         """Test the constraints for moving content."""
         from plone.api.exc import MissingParameterError
@@ -859,6 +1280,51 @@ class TestPloneApiContent(unittest.TestCase):
         self.assertNotIn("copy_of_about", container)
         self.assertNotIn("about", container["events"])
 
+    def test_delete_multiple_grouped(self):
+        """Test that objects are deleted with one call per container."""
+        container = self.portal
+        events = container["events"]
+        objects = [
+            events["training"],
+            container["about"],
+            self.team,
+            events["sprint"],
+            events["training"],
+        ]
+        from OFS.ObjectManager import ObjectManager
+
+        deleted = []
+        manage_delObjects = ObjectManager.manage_delObjects
+
+        def record(self, ids=[], REQUEST=None):
+            deleted.append(list(ids))
+            return manage_delObjects(self, ids, REQUEST=REQUEST)
+
+        with mock.patch.object(ObjectManager, "manage_delObjects", record):
+            api.content.delete(objects=objects, check_linkintegrity=False)
+
+        # The team page is deleted together with the about folder
+        self.assertEqual(deleted, [["training", "sprint"], ["about"]])
+        self.assertEqual(events.keys(), ["conference"])
+        self.assertNotIn("about", container)
+
+    def test_delete_multiple_batches(self):
+        """Test that a savepoint is made after every batch."""
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.delete(obj=self.sprint, batch_size=0)
+
+        events = self.portal["events"]
+        with mock.patch("plone.api.content.transaction") as transaction:
+            api.content.delete(
+                objects=list(events.objectValues()),
+                check_linkintegrity=False,
+                batch_size=2,
+            )
+        self.assertEqual(transaction.savepoint.call_count, 2)
+        self.assertEqual(events.keys(), [])
+
     def test_delete_no_objs(self):
         # Check that we allow passing in an empty list of objects.
         api.content.delete(obj=None, objects=[])
@@ -968,6 +1434,182 @@ class TestPloneApiContent(unittest.TestCase):
         )
         self.assertEqual(len(documents), 2)
 
+    def test_find_fields(self):
+        """Test getting plain metadata rows instead of brains."""
+        from plone.api.exc import InvalidParameterError
+
+        rows = api.content.find(
+            portal_type="Document",
+            sort_on="id",
+            fields=("UID", "path", "Title"),
+        )
+        self.assertListEqual(
+            rows,
+            [
+                (self.contact.UID(), "/plone/about/contact", ""),
+                (self.team.UID(), "/plone/about/team", ""),
+            ],
+        )
+        self.assertEqual(rows[0].UID, self.contact.UID())
+        self.assertEqual(rows[0].path, "/plone/about/contact")
+
+        # All metadata columns are returned with as_rows
+        catalog = api.portal.get_tool("portal_catalog")
+        rows = api.content.find(portal_type="Document", as_rows=True)
+        self.assertEqual(len(rows), 2)
+        self.assertTupleEqual(rows[0]._fields, tuple(catalog.schema()))
+
+        # Columnar results
+        columns = api.content.find(
+            portal_type="Document",
+            sort_on="id",
+            fields=["getId", "portal_type"],
+            as_columns=True,
+        )
+        self.assertDictEqual(
+            columns,
+            {"getId": ["contact", "team"], "portal_type": ["Document", "Document"]},
+        )
+
+        # Queries without valid indexes still return nothing
+        self.assertListEqual(api.content.find(fields=["UID"]), [])
+        self.assertDictEqual(
+            api.content.find(fields=["UID"], as_columns=True),
+            {"UID": []},
+        )
+
+        with self.assertRaises(InvalidParameterError) as cm:
+            api.content.find(portal_type="Document", fields=["UID", "foo"])
+        self.assertIn("Cannot find the metadata column(s) foo", str(cm.exception))
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.find(portal_type="Document", fields=[])
+
+    def test_find_iter(self):
+        """Test iterating over the found objects."""
+        documents = list(api.content.find_iter(portal_type="Document"))
+        self.assertListEqual(
+            sorted(obj.id for obj in documents),
+            ["contact", "team"],
+        )
+
+        # Invalid queries yield nothing, like find()
+        self.assertListEqual(list(api.content.find_iter()), [])
+        self.assertListEqual(list(api.content.find_iter(invalid_index="henk")), [])
+
+        events = list(api.content.find_iter(context=self.events, depth=1, sort_on="id"))
+        self.assertListEqual(
+            [obj.id for obj in events],
+            ["conference", "sprint", "training"],
+        )
+
+    def test_find_iter_unrestricted(self):
+        """Test iterating over the found objects without security checks."""
+        from plone.app.testing import logout
+
+        logout()
+        documents = list(api.content.find_iter(portal_type="Document"))
+        self.assertEqual(len(documents), 0)
+
+        documents = list(
+            api.content.find_iter(portal_type="Document", unrestricted=True)
+        )
+        self.assertEqual(len(documents), 2)
+
+    def test_find_iter_projection(self):
+        """Test that find_iter rejects the projection parameters of find."""
+        from plone.api.exc import InvalidParameterError
+
+        for kwargs in ({"fields": ["id"]}, {"as_rows": True}, {"as_columns": True}):
+            with self.assertRaises(InvalidParameterError):
+                list(api.content.find_iter(portal_type="Event", **kwargs))
+
+    def test_find_iter_minimizes_cache(self):
+        """Test that the connection cache is minimized after each chunk."""
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(InvalidParameterError):
+            list(api.content.find_iter(portal_type="Event", chunk_size=0))
+
+        connection = self.portal._p_jar
+        with mock.patch.object(connection, "cacheMinimize") as cacheMinimize:
+            events = list(api.content.find_iter(portal_type="Event", chunk_size=2))
+            self.assertEqual(len(events), 3)
+            self.assertEqual(cacheMinimize.call_count, 2)
+
+            cacheMinimize.reset_mock()
+            events = list(
+                api.content.find_iter(
+                    portal_type="Event",
+                    chunk_size=2,
+                    minimize_cache=False,
+                )
+            )
+            self.assertEqual(len(events), 3)
+            cacheMinimize.assert_not_called()
+
+    def test_find_unknown_query_parameters(self):
+        """Test that unknown query parameters are reported."""
+        with self.assertLogs("plone.api.content", level="WARNING") as cm:
+            documents = api.content.find(
+                invalid_index="henk",
+                portal_type="Document",
+                sort_on="id",
+            )
+        self.assertEqual(len(documents), 2)
+        self.assertListEqual(
+            cm.output,
+            [
+                "WARNING:plone.api.content:"
+                "Ignoring unknown catalog query parameter(s): invalid_index",
+            ],
+        )
+
+    def test_parse_query(self):
+        """Test the normalization of catalog queries."""
+        from plone.api.content import _parse_query
+
+        catalog = api.portal.get_tool("portal_catalog")
+        query, unknown = _parse_query(
+            catalog,
+            context=self.events,
+            depth=1,
+            object_provides=IFolderish,
+            sort_on="id",
+            foo="bar",
+        )
+        self.assertDictEqual(
+            query,
+            {
+                "path": {"query": "/plone/events", "depth": 1},
+                "object_provides": {
+                    "query": [IFolderish.__identifier__],
+                    "operator": "or",
+                },
+                "sort_on": "id",
+                "foo": "bar",
+            },
+        )
+        self.assertListEqual(unknown, ["foo"])
+
+    def test_catalog_indexes_cache(self):
+        """Test that the index names are cached until the catalog changes."""
+        from plone.api.content import _catalog_indexes
+
+        catalog = api.portal.get_tool("portal_catalog")
+        self.assertFalse(catalog._catalog._p_changed)
+
+        indexes = _catalog_indexes(catalog)
+        self.assertSetEqual(indexes, set(catalog.indexes()))
+        self.assertIs(_catalog_indexes(catalog), indexes)
+
+        catalog.addIndex("my_index", "FieldIndex")
+        self.assertIn("my_index", _catalog_indexes(catalog))
+        self.assertEqual(len(api.content.find(my_index="foo")), 0)
+
+        catalog.delIndex("my_index")
+        self.assertNotIn("my_index", _catalog_indexes(catalog))
+
     def test_find_context(self):
         # Find documents in context
         documents = api.content.find(
@@ -1247,6 +1889,69 @@ class TestPloneApiContent(unittest.TestCase):
         review_state = api.content.get_state(obj=self.blog, default=default)
         review_state is not default
 
+    def test_get_states(self):
+        """Test retrieving the workflow states of many items at once."""
+        with self.assertRaises(MissingParameterError):
+            api.content.get_states()
+
+        api.content.transition(obj=self.blog, transition="publish")
+        brain = api.content.find(UID=self.team.UID())[0]
+        states = api.content.get_states(
+            [self.blog, brain, self.contact.UID(), self.image, "notfound"],
+        )
+        self.assertDictEqual(
+            states,
+            {
+                self.blog.UID(): "published",
+                self.team.UID(): "private",
+                self.contact.UID(): "private",
+                self.image.UID(): None,
+            },
+        )
+        self.assertListEqual(
+            list(states),
+            [self.blog.UID(), self.team.UID(), self.contact.UID(), self.image.UID()],
+        )
+
+        states = api.content.get_states([self.image], default="Unknown")
+        self.assertDictEqual(states, {self.image.UID(): "Unknown"})
+
+    def test_get_states_restricted(self):
+        """Test that UIDs of inaccessible items are left out."""
+        from plone.app.testing import logout
+
+        uid = self.team.UID()
+        logout()
+
+        self.assertEqual(api.content.get_many(UIDs=[uid]), [None])
+        self.assertDictEqual(api.content.get_states([uid]), {})
+        self.assertDictEqual(
+            api.content.get_states([uid], unrestricted=True),
+            {uid: "private"},
+        )
+
+    def test_get_states_from_catalog(self):
+        """Test that cataloged items are not loaded to get their state."""
+        brains = api.content.find(portal_type="Document")
+        with mock.patch("plone.api.content.get_state") as get_state:
+            states = api.content.get_states(brains)
+            states.update(api.content.get_states([self.team]))
+        get_state.assert_not_called()
+        self.assertDictEqual(
+            states,
+            {self.team.UID(): "private", self.contact.UID(): "private"},
+        )
+
+    def test_get_states_uncataloged(self):
+        """Test that uncataloged items fall back to the workflow tool."""
+        self.team.unindexObject()
+        processQueue()
+        states = api.content.get_states([self.team, self.contact])
+        self.assertDictEqual(
+            states,
+            {self.team.UID(): "private", self.contact.UID(): "private"},
+        )
+
     def test_transition(self):
         """Test transitioning the workflow state on a content item."""
         from plone.api.exc import InvalidParameterError
@@ -1318,6 +2023,115 @@ class TestPloneApiContent(unittest.TestCase):
             "internally_published",
         )
 
+    def test_transition_many_constraints(self):
+        """Test the constraints when transitioning many objects."""
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.transition_many(transition="publish")
+
+        with self.assertRaises(MissingParameterError):
+            api.content.transition_many(objects=[self.blog])
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.transition_many(
+                objects=[self.blog],
+                transition="publish",
+                to_state="published",
+            )
+
+    def test_transition_many(self):
+        """Test transitioning many objects at once."""
+        api.content.transition(obj=self.contact, transition="publish")
+        results = api.content.transition_many(
+            objects=[self.blog, self.team, self.contact],
+            transition="publish",
+        )
+        self.assertListEqual(
+            list(results),
+            [self.blog.UID(), self.team.UID(), self.contact.UID()],
+        )
+        self.assertIsNone(results[self.blog.UID()])
+        self.assertIsNone(results[self.team.UID()])
+        # The contact page was already published
+        self.assertIsInstance(results[self.contact.UID()], WorkflowException)
+        self.assertEqual(api.content.get_state(self.blog), "published")
+        self.assertEqual(api.content.get_state(self.team), "published")
+
+        # The catalog is up to date after the batch
+        self.assertEqual(
+            len(api.content.find(portal_type="Document", review_state="published")),
+            2,
+        )
+
+        # Objects without a workflow are reported as well
+        results = api.content.transition_many(
+            objects=[self.blog, self.team, self.image],
+            to_state="private",
+            comment="Back to private",
+        )
+        self.assertIsNone(results[self.blog.UID()])
+        self.assertIsNone(results[self.team.UID()])
+        self.assertIsInstance(results[self.image.UID()], WorkflowException)
+        self.assertEqual(api.content.get_state(self.blog), "private")
+        self.assertEqual(api.content.get_state(self.team), "private")
+        history = self.team.workflow_history["simple_publication_workflow"]
+        self.assertEqual(history[-1]["comments"], "Back to private")
+
+    def test_transition_many_to_state_route(self):
+        """Test that the route is looked up once per workflow."""
+        from plone.api import content
+
+        portal_workflow = api.portal.get_tool("portal_workflow")
+        portal_workflow._chains_by_type["File"] = ("intranet_workflow",)
+        files = [
+            api.content.create(container=self.portal, type="File", id=f"file-{i}")
+            for i in range(3)
+        ]
+        with mock.patch(
+            "plone.api.content._wf_routes_for",
+            wraps=content._wf_routes_for,
+        ) as routes_for:
+            results = api.content.transition_many(
+                objects=files,
+                to_state="internally_published",
+            )
+        self.assertEqual(routes_for.call_count, 1)
+        self.assertListEqual(list(results.values()), [None, None, None])
+        for obj in files:
+            self.assertEqual(api.content.get_state(obj), "internally_published")
+
+    def test_wf_transitions_for(self):
+        """Test the cached routing table used by transition(to_state=...)."""
+        from plone.api.content import _wf_routes_for
+        from plone.api.content import _wf_transitions_for
+
+        portal_workflow = api.portal.get_tool("portal_workflow")
+        workflow = portal_workflow["intranet_workflow"]
+
+        self.assertListEqual(
+            _wf_transitions_for(workflow, "internal", "internally_published"),
+            ["publish_internally"],
+        )
+        self.assertListEqual(
+            _wf_transitions_for(workflow, "private", "internally_published"),
+            ["show_internally", "publish_internally"],
+        )
+        self.assertIsNone(_wf_transitions_for(workflow, "private", "private"))
+        self.assertIsNone(_wf_transitions_for(workflow, "private", "foo"))
+        self.assertIsNone(_wf_transitions_for(workflow, "foo", "private"))
+
+        # The table is only computed once per workflow definition
+        routes = _wf_routes_for(workflow)
+        self.assertIs(_wf_routes_for(workflow), routes)
+
+        # and recomputed when the transitions of a state change.
+        workflow.states["private"].transitions = ()
+        self.assertIsNot(_wf_routes_for(workflow), routes)
+        self.assertIsNone(
+            _wf_transitions_for(workflow, "private", "internally_published"),
+        )
+
     def test_disable_roles_acquisition(self):
         """Test disabling local roles acquisition."""
         # This should fail because an content item is mandatory
@@ -1457,6 +2271,95 @@ class TestPloneApiContent(unittest.TestCase):
         for should_be_there in should_be_theres:
             self.assertIn((should_be_there + "\n"), str(cm.exception))
 
+    def test_get_view_lazy_available_views(self):
+        """Test that the available views are only listed when formatted."""
+        from plone.api.exc import InvalidParameterError
+        from zope.component import getSiteManager
+
+        request = self.layer["request"]
+        adapters = getSiteManager().adapters
+        with mock.patch.object(
+            adapters, "lookupAll", wraps=adapters.lookupAll
+        ) as lookup_all:
+            for _ in range(3):
+                with self.assertRaises(InvalidParameterError) as cm:
+                    api.content.get_view(name="foo", context=self.blog, request=request)
+            lookup_all.assert_not_called()
+
+            message = str(cm.exception)
+            self.assertIn("\nplone\n", message)
+            self.assertEqual(str(cm.exception), message)
+            lookup_all.assert_called_once()
+
+        # Like other plone.api errors, the first argument is a string
+        self.assertEqual(cm.exception.args, ("Cannot find a view with name 'foo'.",))
+        error = pickle.loads(pickle.dumps(cm.exception))
+        self.assertEqual(str(error), message)
+
+    def test_get_view_lazy_available_views_unavailable(self):
+        """Test that the message leaves out the views it cannot list."""
+        from plone.api.exc import InvalidParameterError
+        from zope.component import getSiteManager
+
+        request = self.layer["request"]
+        adapters = getSiteManager().adapters
+        with mock.patch.object(adapters, "lookupAll", side_effect=KeyError):
+            with self.assertRaises(InvalidParameterError) as cm:
+                api.content.get_view(name="foo", context=self.blog, request=request)
+            self.assertEqual(str(cm.exception), "Cannot find a view with name 'foo'.")
+
+    def test_get_view_factory_returns_none(self):
+        """Test that a view factory returning None is a missing view."""
+        from plone.api.exc import InvalidParameterError
+        from zope.component import getGlobalSiteManager
+        from zope.publisher.interfaces.browser import IDefaultBrowserLayer
+
+        def factory(context, request):
+            return None
+
+        gsm = getGlobalSiteManager()
+        gsm.registerAdapter(
+            factory, (Interface, IDefaultBrowserLayer), Interface, name="nothing"
+        )
+        self.addCleanup(
+            gsm.unregisterAdapter,
+            factory,
+            (Interface, IDefaultBrowserLayer),
+            Interface,
+            name="nothing",
+        )
+        with self.assertRaises(InvalidParameterError):
+            api.content.get_view(
+                name="nothing", context=self.blog, request=self.layer["request"]
+            )
+
+    def test_get_view_registry_changes(self):
+        """Test that views registered after a failed lookup are found."""
+        from plone.api.exc import InvalidParameterError
+        from zope.component import getGlobalSiteManager
+        from zope.publisher.browser import BrowserView
+        from zope.publisher.interfaces.browser import IDefaultBrowserLayer
+
+        request = self.layer["request"]
+        with self.assertRaises(InvalidParameterError):
+            api.content.get_view(name="foo", context=self.blog, request=request)
+
+        gsm = getGlobalSiteManager()
+        gsm.registerAdapter(
+            BrowserView, (Interface, IDefaultBrowserLayer), Interface, name="foo"
+        )
+        try:
+            view = api.content.get_view(name="foo", context=self.blog, request=request)
+            self.assertIsInstance(view, BrowserView)
+            self.assertEqual(view.context, self.blog)
+        finally:
+            gsm.unregisterAdapter(
+                BrowserView, (Interface, IDefaultBrowserLayer), Interface, name="foo"
+            )
+
+        with self.assertRaises(InvalidParameterError):
+            api.content.get_view(name="foo", context=self.blog, request=request)
+
     def test_get_path_absolute(self):
         """Test getting the path of a content object with relative parameter set to False."""
         from plone.api.exc import InvalidParameterError
@@ -1606,6 +2509,73 @@ class TestPloneApiContent(unittest.TestCase):
             tuple(api.content.iter_ancestors(object(), stop_at=False)), ()
         )
 
+    def test_iter_ancestors_lazy(self):
+        """Test that the ancestors are only walked as far as needed"""
+        checked = []
+
+        def is_about(obj):
+            checked.append(obj)
+            return obj == self.about
+
+        self.assertEqual(
+            api.content.get_closest_ancestor(
+                self.team, function=is_about, stop_at=False
+            ),
+            self.about,
+        )
+        self.assertEqual(checked, [self.about])
+
+    def test_iter_ancestors_cache(self):
+        """Test that chains of parents are shared within a request"""
+        from plone.api.content import _ancestor_cache
+
+        api.portal.enable_lookup_cache()
+        self.addCleanup(api.portal.enable_lookup_cache, False)
+        app = self.layer["app"]
+
+        self.assertTupleEqual(
+            tuple(api.content.iter_ancestors(self.team, stop_at=False)),
+            (self.about, self.portal, app, app.aq_parent),
+        )
+        request, txn, chains = _ancestor_cache.entry
+        self.assertEqual(len(chains), 4)
+
+        # A sibling reuses the chain of its parent
+        self.assertTupleEqual(
+            tuple(api.content.iter_ancestors(self.contact)), (self.about, self.portal)
+        )
+        self.assertIs(_ancestor_cache.entry[2], chains)
+        self.assertEqual(len(chains), 4)
+
+        # Without the lookup cache nothing is kept
+        api.portal.enable_lookup_cache(False)
+        self.assertTupleEqual(
+            tuple(api.content.iter_ancestors(self.contact)), (self.about, self.portal)
+        )
+        self.assertIsNone(_ancestor_cache.entry)
+
+    def test_iter_ancestors_cache_move(self):
+        """Test that moving objects drops the cached chains of parents"""
+        api.portal.enable_lookup_cache()
+        self.addCleanup(api.portal.enable_lookup_cache, False)
+
+        self.assertListEqual(
+            [a.getId() for a in api.content.iter_ancestors(self.team)],
+            ["about", "plone"],
+        )
+        api.content.move(source=self.about, target=self.events)
+        team = self.portal["events"]["about"]["team"]
+        self.assertListEqual(
+            [a.getId() for a in api.content.iter_ancestors(team)],
+            ["about", "events", "plone"],
+        )
+        self.assertEqual(
+            api.content.get_closest_ancestor(
+                team, function=lambda obj: obj.getId() == "events"
+            ).getId(),
+            "events",
+        )
+
     def test_get_closest_ancestor_required_parameter(self):
         """Test that get_closest_ancestor requires an obj parameter"""
         with self.assertRaises(MissingParameterError):
@@ -1646,6 +2616,37 @@ class TestPloneApiContent(unittest.TestCase):
         """Test getting the closest ancestor of the portal"""
         self.assertIsNone(api.content.get_closest_ancestor(self.portal))
 
+    def test_get_closest_ancestors(self):
+        """Test getting the closest ancestors of many items from the catalog"""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.content.get_closest_ancestors(items=[self.team])
+
+        subfolder = api.content.create(
+            container=self.about, type="Folder", id="subfolder"
+        )
+        page = api.content.create(container=subfolder, type="Document", id="page")
+        alsoProvides(self.about, INavigationRoot)
+        self.about.reindexObject(idxs=["object_provides"])
+
+        team_brain = api.content.find(UID=self.team.UID())[0]
+        self.assertEqual(
+            api.content.get_closest_ancestors(
+                items=[team_brain, page, self.portal, self.about, self.blog],
+                interface=INavigationRoot,
+            ),
+            [self.about, self.about, None, self.portal, self.portal],
+        )
+
+        self.assertEqual(
+            api.content.get_closest_ancestors(items=[page], interface=IFolder),
+            [subfolder],
+        )
+        self.assertEqual(
+            api.content.get_closest_ancestors(items=[], interface=IFolder), []
+        )
+
     def test_get_closest_ancestor_bogus_stop_at(self):
         """Check that when we pass to the ``stop_at`` parameter something
         that is not in the acquisition chain, we raise an error."""
@@ -1663,3 +2664,55 @@ class TestPloneApiContent(unittest.TestCase):
     def test_get_closest_ancestor_not_acquisition_aware_object(self):
         """Test that get_closest_ancestor requires an obj parameter"""
         self.assertIsNone(api.content.get_closest_ancestor(object(), stop_at=False))
+
+
+class TestPloneApiContentCopyTreeBackground(unittest.TestCase):
+    """Test copying a tree in a thread, which needs real commits."""
+
+    layer = FUNCTIONAL_TESTING
+
+    def test_copy_tree_background(self):
+        """Test copying a tree in the background."""
+        portal = self.layer["portal"]
+        folder = api.content.create(container=portal, type="Folder", id="folder")
+        for index in range(5):
+            api.content.create(container=folder, type="Document", id=f"page-{index}")
+        transaction.commit()
+
+        status = api.content.copy_tree(
+            source=folder,
+            target=portal,
+            id="copy",
+            batch_size=2,
+            background=True,
+        )
+        self.assertTrue(status.wait(timeout=60))
+        self.assertEqual(status.state, "done", status.error)
+        self.assertEqual(status.copied, 6)
+
+        transaction.begin()
+        self.assertEqual(
+            portal["copy"].objectIds(),
+            [f"page-{index}" for index in range(5)],
+        )
+        self.assertEqual(len(api.content.find(path="/plone/copy")), 6)
+
+    def test_copy_tree_background_failure(self):
+        """Test that a failing copy in the background reports the error."""
+        portal = self.layer["portal"]
+        folder = api.content.create(container=portal, type="Folder", id="folder")
+        transaction.commit()
+
+        with mock.patch(
+            "plone.api.content._copy_tree",
+            side_effect=ValueError("broken"),
+        ):
+            status = api.content.copy_tree(
+                source=folder,
+                target=portal,
+                background=True,
+            )
+            self.assertTrue(status.wait(timeout=60))
+
+        self.assertEqual(status.state, "failed")
+        self.assertIsInstance(status.error, ValueError)
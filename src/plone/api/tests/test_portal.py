@@ -1,5 +1,6 @@
 """Tests for plone.api.portal."""
 
+from Acquisition import aq_base
 from datetime import date
 from datetime import datetime
 from email import message_from_bytes
@@ -10,22 +11,32 @@ from plone.api import portal
 from plone.api.tests.base import INTEGRATION_TESTING
 from plone.base.interfaces import INavigationRoot
 from plone.registry import field
+from plone.registry.interfaces import IRecordModifiedEvent
 from plone.registry.interfaces import IRegistry
 from plone.registry.record import Record
 from Products.CMFCore.utils import getToolByName
 from Products.CMFPlone.tests.utils import MockMailHost
 from Products.MailHost.interfaces import IMailHost
+from Products.MailHost.MailHost import MailHost
 from unittest import mock
 from unittest.mock import MagicMock
 from zope import schema
+from zope.component import getGlobalSiteManager
 from zope.component import getUtility
 from zope.component.hooks import setSite
 from zope.interface import Interface
 from zope.schema.vocabulary import SimpleVocabulary
+from zope.sendmail.delivery import MailDataManager
+from zope.sendmail.maildir import Maildir
 from zope.site import LocalSiteManager
 from ZPublisher.HTTPRequest import HTTPRequest
 
 import DateTime
+import os
+import smtplib
+import tempfile
+import time
+import transaction
 import unittest
 
 HAS_PLONE5 = version.parse(env.plone_version()) >= version.parse("5.0b2")
@@ -113,6 +124,13 @@ class TestPloneApiPortal(unittest.TestCase):
             value="%b %d, %Y",
         )
 
+    def _set_request_language(self, lang):
+        """Let the request prefer the language."""
+        request = self.layer["request"]
+        request.environ["HTTP_ACCEPT_LANGUAGE"] = lang
+        request.other.pop("LANGUAGE", None)
+        request.other.pop("LANGUAGE_TOOL", None)
+
     def test_get(self):
         """Test getting the portal object."""
         self.assertEqual(portal.get(), self.portal)
@@ -197,6 +215,75 @@ class TestPloneApiPortal(unittest.TestCase):
             getToolByName(self.portal, "portal_membership"),
         )
 
+    def test_lookup_cache(self):
+        """Test the opt-in cache of the portal object and its tools."""
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+        portal.get_lookup_cache_stats(reset=True)
+
+        self.assertEqual(portal.get(), self.portal)
+        self.assertIs(portal.get(), portal.get())
+        catalog = portal.get_tool("portal_catalog")
+        self.assertIs(portal.get_tool("portal_catalog"), catalog)
+        self.assertEqual(catalog, getToolByName(self.portal, "portal_catalog"))
+
+        # Unknown tools are not cached
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(InvalidParameterError):
+            portal.get_tool("portal_foo")
+
+        # Each lookup is counted once, get_tool() does not count the portal
+        stats = portal.get_lookup_cache_stats(reset=True)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 3)
+        self.assertAlmostEqual(stats["hit_rate"], 3 / 6)
+        self.assertDictEqual(
+            portal.get_lookup_cache_stats(),
+            {"hits": 0, "misses": 0, "hit_rate": 0.0},
+        )
+
+    def test_lookup_cache_invalidation(self):
+        """Test that the cache is only used for the same site and request."""
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+        portal.get()
+        portal.get_lookup_cache_stats(reset=True)
+
+        # A different request
+        with mock.patch("plone.api.portal.getRequest", return_value=None):
+            self.assertEqual(portal.get(), self.portal)
+        self.assertEqual(portal.get_lookup_cache_stats()["misses"], 1)
+
+        # A different site
+        a_site = content.create(
+            container=self.portal,
+            type="Folder",
+            title="A Site",
+        )
+        a_site.setSiteManager(LocalSiteManager(a_site))
+        setSite(a_site)
+        self.addCleanup(setSite, self.portal)
+        self.assertEqual(portal.get(), self.portal)
+        self.assertEqual(portal.get_lookup_cache_stats()["misses"], 2)
+
+        # No site at all
+        setSite(None)
+        from plone.api.exc import CannotGetPortalError
+
+        with self.assertRaises(CannotGetPortalError):
+            portal.get()
+
+    def test_lookup_cache_disabled(self):
+        """Test that nothing is cached or counted by default."""
+        portal.get_lookup_cache_stats(reset=True)
+        portal.get()
+        portal.get_tool("portal_catalog")
+        self.assertDictEqual(
+            portal.get_lookup_cache_stats(),
+            {"hits": 0, "misses": 0, "hit_rate": 0.0},
+        )
+
     def test_send_email_constraints(self):
         """Test the constraints for sending an email."""
         from plone.api.exc import MissingParameterError
@@ -352,6 +439,210 @@ class TestPloneApiPortal(unittest.TestCase):
             self.portal.MailHost.smtp_host = old_smtp_host
         portal.PRINTINGMAILHOST_ENABLED = old_flag
 
+    def _finish_mail_transaction(self):
+        """Run the commit phase of the pending mail data managers."""
+        txn = transaction.get()
+        for resource in list(txn._resources):
+            if isinstance(resource, MailDataManager):
+                resource.tpc_vote(txn)
+                resource.tpc_finish(txn)
+
+    def test_send_emails_constraints(self):
+        """Test the constraints for sending emails."""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.send_emails()
+
+        # Every message needs a recipient, a subject and a body
+        with self.assertRaises(MissingParameterError) as cm:
+            portal.send_emails(
+                [
+                    {"recipient": "bob@plone.org", "subject": "Trappist", "body": "!"},
+                    {"recipient": "joe@plone.org", "body": "!"},
+                ]
+            )
+        self.assertIn("subject in message 1", str(cm.exception))
+
+        self.mailhost.reset()
+        self.assertEqual(portal.send_emails([]), 0)
+        self.assertEqual(len(self.mailhost.messages), 0)
+
+    def test_send_emails(self):
+        """Test sending many mails through the MailHost."""
+        self.mailhost.reset()
+
+        with mock.patch.object(content, "get_view", wraps=content.get_view) as view:
+            sent = portal.send_emails(
+                [
+                    {
+                        "recipient": f"reader{i}@plone.org",
+                        "subject": "Newsletter",
+                        "body": f"Issue for reader {i}",
+                    }
+                    for i in range(3)
+                ]
+                + [
+                    {
+                        "recipient": "bob@plone.org",
+                        "sender": "noreply@plone.org",
+                        "subject": "Trappist",
+                        "body": "One for you Bob!",
+                    }
+                ]
+            )
+        # The MailHost configuration is only checked once
+        self.assertEqual(view.call_count, 1)
+
+        self.assertEqual(sent, 4)
+        self.assertEqual(len(self.mailhost.messages), 4)
+        msg = message_from_bytes(self.mailhost.messages[2])
+        self.assertEqual(msg["To"], "reader2@plone.org")
+        self.assertEqual(msg["From"], "Portal Owner <sender@example.org>")
+        self.assertEqual(msg.get_payload(), "Issue for reader 2")
+        msg = message_from_bytes(self.mailhost.messages[3])
+        self.assertEqual(msg["To"], "bob@plone.org")
+        self.assertEqual(msg["From"], "noreply@plone.org")
+
+    def test_send_emails_without_configured_mailhost(self):
+        """Nothing is sent when the MailHost is not configured."""
+        old_value = portal.get_registry_record("plone.email_from_address")
+        portal.set_registry_record("plone.email_from_address", "")
+        self.mailhost.reset()
+
+        with self.assertRaises(ValueError):
+            portal.send_emails(
+                [{"recipient": "bob@plone.org", "subject": "Trappist", "body": "!"}]
+            )
+        self.assertEqual(len(self.mailhost.messages), 0)
+
+        portal.set_registry_record("plone.email_from_address", old_value)
+
+    def _smtp_mailhost(self):
+        """Replace the mock MailHost by a real, SMTP sending one."""
+        mailhost = MailHost("MailHost", smtp_host="localhost")
+        self.portal.MailHost = mailhost
+        sm = self.portal.getSiteManager()
+        sm.registerUtility(component=mailhost, provided=IMailHost)
+        connection = MagicMock()
+        connection.ehlo.return_value = (250, "OK")
+        connection.has_extn.return_value = False
+        connection.does_esmtp = False
+        return mock.patch("zope.sendmail.mailer.SMTP", return_value=connection)
+
+    def test_send_emails_one_connection(self):
+        """All mails are sent over one SMTP connection at commit time."""
+        messages = [
+            {"recipient": f"reader{i}@plone.org", "subject": "News", "body": "!"}
+            for i in range(5)
+        ]
+        with self._smtp_mailhost() as smtp:
+            portal.send_emails(messages)
+            # Nothing is sent before the transaction is committed
+            self.assertEqual(smtp.call_count, 0)
+
+            self._finish_mail_transaction()
+
+        self.assertEqual(smtp.call_count, 1)
+        connection = smtp.return_value
+        self.assertEqual(connection.sendmail.call_count, 5)
+        self.assertEqual(
+            connection.sendmail.call_args_list[4][0][:2],
+            ("Portal Owner <sender@example.org>", ["reader4@plone.org"]),
+        )
+        self.assertEqual(connection.quit.call_count, 1)
+
+    def test_send_emails_immediate(self):
+        """A refused mail does not stop the rest of the batch."""
+        with self._smtp_mailhost() as smtp:
+            connection = smtp.return_value
+            connection.sendmail.side_effect = [
+                smtplib.SMTPRecipientsRefused({"bad@plone.org": (550, "Nope")}),
+                {},
+            ]
+            portal.send_emails(
+                [
+                    {"recipient": "bad@plone.org", "subject": "News", "body": "!"},
+                    {"recipient": "bob@plone.org", "subject": "News", "body": "!"},
+                ],
+                immediate=True,
+            )
+
+        self.assertEqual(smtp.call_count, 1)
+        self.assertEqual(connection.sendmail.call_count, 2)
+        self.assertEqual(connection.quit.call_count, 1)
+
+    def test_send_emails_chunks(self):
+        """A new SMTP connection is opened per chunk of mails."""
+        messages = [
+            {"recipient": f"reader{i}@plone.org", "subject": "News", "body": "!"}
+            for i in range(5)
+        ]
+        with self._smtp_mailhost() as smtp:
+            with mock.patch("plone.api.portal.SEND_EMAILS_CHUNK_SIZE", 2):
+                self.assertEqual(portal.send_emails(messages, immediate=True), 5)
+
+        self.assertEqual(smtp.call_count, 3)
+        connection = smtp.return_value
+        self.assertEqual(connection.sendmail.call_count, 5)
+        self.assertEqual(connection.quit.call_count, 3)
+
+    def test_send_emails_reconnect(self):
+        """The connection is opened again when the server drops it."""
+        messages = [
+            {"recipient": f"reader{i}@plone.org", "subject": "News", "body": "!"}
+            for i in range(3)
+        ]
+        with self._smtp_mailhost() as smtp:
+            connection = smtp.return_value
+            connection.sendmail.side_effect = [
+                {},
+                smtplib.SMTPServerDisconnected("Too many messages"),
+                {},
+                {},
+            ]
+            portal.send_emails(messages)
+            self._finish_mail_transaction()
+
+        self.assertEqual(smtp.call_count, 2)
+        self.assertEqual(
+            [call[0][1] for call in connection.sendmail.call_args_list],
+            [
+                ["reader0@plone.org"],
+                ["reader1@plone.org"],
+                ["reader1@plone.org"],
+                ["reader2@plone.org"],
+            ],
+        )
+        self.assertEqual(connection.quit.call_count, 1)
+
+    def test_send_emails_spool_directory(self):
+        """Mails can be written to a maildir instead of being sent."""
+        self.mailhost.reset()
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            spool_directory = os.path.join(tmp_directory, "spool")
+            portal.send_emails(
+                [
+                    {"recipient": "bob@plone.org", "subject": "Trappist", "body": "!"},
+                    {"recipient": "joe@plone.org", "subject": "Trappist", "body": "!"},
+                ],
+                spool_directory=spool_directory,
+            )
+            self.assertEqual(list(Maildir(spool_directory)), [])
+
+            self._finish_mail_transaction()
+
+            spooled = []
+            for path in Maildir(spool_directory):
+                with open(path, "rb") as spool_file:
+                    spooled.append(message_from_bytes(spool_file.read()))
+
+        self.assertEqual(
+            sorted(msg["X-Zope-To"] for msg in spooled),
+            ["bob@plone.org", "joe@plone.org"],
+        )
+        self.assertEqual(len(self.mailhost.messages), 0)
+
     def test_get_localized_time_constraints(self):
         """Test the constraints for get_localized_time."""
 
@@ -433,6 +724,112 @@ class TestPloneApiPortal(unittest.TestCase):
         )
         self.assertEqual(result, "Dec 31, 1999")
 
+    def test_get_localized_times(self):
+        """Test getting many localized times at once."""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.get_localized_times()
+
+        values = [
+            DateTime.DateTime(1999, 12, 31, 23, 59),
+            datetime(2000, 1, 1, 9, 30),
+            date(2000, 2, 29),
+            "2000/03/01 12:00",
+            "not a date",
+        ]
+        self.assertEqual(
+            portal.get_localized_times(values),
+            ["Dec 31, 1999", "Jan 01, 2000", "Feb 29, 2000", "Mar 01, 2000", None],
+        )
+        self.assertEqual(
+            portal.get_localized_times(values, long_format=True),
+            [
+                "Dec 31, 1999 11:59 PM",
+                "Jan 01, 2000 09:30 AM",
+                "Feb 29, 2000",
+                "Mar 01, 2000 12:00 PM",
+                None,
+            ],
+        )
+        self.assertEqual(
+            portal.get_localized_times(values[:3], time_only=True),
+            ["11:59 PM", "09:30 AM", ""],
+        )
+        self.assertEqual(portal.get_localized_times([]), [])
+
+    def test_get_localized_times_languages(self):
+        """Test that the compiled formats match ulocalized_time."""
+        request = self.layer["request"]
+        tool = portal.get_tool("translation_service")
+        value = DateTime.DateTime(1999, 12, 31, 23, 59)
+        formats = (
+            {},
+            {"long_format": True},
+            {"time_only": True},
+            {"long_format": "${A} ${a} ${d}. ${B} ${b} ${Y}"},
+            {"long_format": "${H}:${M}:${S} ${I} ${p} ${y} ${m} $${Y} ${x}"},
+            {"long_format": "%Y/%m/%d"},
+            {"long_format": True, "time_only": True},
+        )
+
+        def check_parity():
+            for lang in ("en", "de", "pt-br"):
+                self._set_request_language(lang)
+                for kwargs in formats:
+                    self.assertEqual(
+                        portal.get_localized_times([value], **kwargs)[0],
+                        tool.ulocalized_time(
+                            value,
+                            kwargs.get("long_format"),
+                            kwargs.get("time_only"),
+                            domain="plonelocales",
+                            request=request,
+                        ),
+                    )
+
+        check_parity()
+
+        # Formats overridden in the registry
+        name_root = "Products.CMFPlone.i18nl10n.override_dateformat."
+        registry = getUtility(IRegistry)
+        registry[name_root + "Enabled"] = True
+        registry[name_root + "date_format_short"] = "${d}. ${b} ${Y}"
+        registry[name_root + "date_format_long"] = "%d.%m.%Y %H:%M"
+        check_parity()
+
+        self._set_request_language("de")
+        self.assertEqual(
+            portal.get_localized_time(value, long_format="${A}, ${d}. ${B} ${Y}"),
+            "Freitag, 31. Dezember 1999",
+        )
+
+    def test_get_localized_times_cache(self):
+        """Test that the compiled formats are cached with the lookup cache."""
+        from plone.api.portal import zope_translate
+
+        self._set_request_language("de")
+        values = [DateTime.DateTime(1999, 12, day) for day in range(1, 32)]
+        long_format = "${a} ${d}. ${b}"
+
+        with mock.patch(
+            "plone.api.portal.zope_translate", wraps=zope_translate
+        ) as translate:
+            # The format, the 7 weekdays and the month are translated once
+            result = portal.get_localized_times(values, long_format=long_format)
+            self.assertEqual(result[0], "Mit 01. Dez")
+            self.assertEqual(translate.call_count, 1 + 7 + 1)
+
+            portal.get_localized_times(values, long_format=long_format)
+            self.assertEqual(translate.call_count, 2 * (1 + 7 + 1))
+
+            portal.enable_lookup_cache()
+            self.addCleanup(portal.enable_lookup_cache, False)
+            translate.reset_mock()
+            portal.get_localized_times(values, long_format=long_format)
+            portal.get_localized_times(values, long_format=long_format)
+            self.assertEqual(translate.call_count, 1 + 7 + 1)
+
     def test_show_message_constraints(self):
         """Test the constraints for show_message."""
         from plone.api.exc import MissingParameterError
@@ -545,6 +942,92 @@ class TestPloneApiPortal(unittest.TestCase):
         self.assertTrue(exc_str.startswith("Cannot find a record with name"))
         self.assertTrue("Did you mean?:" in exc_str)
 
+    def test_get_invalid_registry_record_suggestions_lazy(self):
+        """Test that suggestions are only looked up when formatted."""
+        from plone.api.exc import InvalidParameterError
+
+        records = getUtility(IRegistry).records
+        with mock.patch.object(records, "keys", wraps=records.keys) as keys:
+            with self.assertRaises(InvalidParameterError) as cm:
+                portal.get_registry_record(name="querystring")
+            keys.assert_not_called()
+            self.assertIn("Did you mean?:", str(cm.exception))
+            self.assertEqual(keys.call_count, 1)
+        self.assertEqual(
+            cm.exception.args, ("Cannot find a record with name 'querystring'",)
+        )
+
+    def test_get_invalid_registry_record_suggestions_indexed(self):
+        """Test that suggestions come from an index with the lookup cache."""
+        from plone.api.exc import InvalidParameterError
+
+        registry = getUtility(IRegistry)
+        with self.assertRaises(InvalidParameterError) as cm:
+            portal.get_registry_record(name="querystring")
+        expected = str(cm.exception)
+
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+
+        with mock.patch.object(
+            registry.records, "keys", wraps=registry.records.keys
+        ) as keys:
+            with self.assertRaises(InvalidParameterError) as cm:
+                portal.get_registry_record(name="querystring")
+            self.assertEqual(str(cm.exception), expected)
+            with self.assertRaises(InvalidParameterError) as cm:
+                portal.get_registry_record(name="a random unique string")
+            self.assertNotIn("Did you mean?:", str(cm.exception))
+            self.assertEqual(keys.call_count, 1)
+
+            # Names shorter than a trigram are not indexed
+            with self.assertRaises(InvalidParameterError) as cm:
+                portal.get_registry_record(name="qu")
+            self.assertIn("Did you mean?:", str(cm.exception))
+            self.assertEqual(keys.call_count, 2)
+
+        # Added and removed records are seen
+        registry.records["plone.api.querystring_power"] = Record(
+            field.TextLine(title="Querystring Power"),
+        )
+        with self.assertRaises(InvalidParameterError) as cm:
+            portal.get_registry_record(name="querystring")
+        self.assertIn("\nplone.api.querystring_power\n", str(cm.exception))
+
+        del registry.records["plone.api.querystring_power"]
+        with self.assertRaises(InvalidParameterError) as cm:
+            portal.get_registry_record(name="querystring")
+        self.assertEqual(str(cm.exception), expected)
+
+    def test_has_registry_record(self):
+        """Test checking if a registry record exists."""
+        from plone.api.exc import InvalidParameterError
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.has_registry_record()
+        with self.assertRaises(InvalidParameterError):
+            portal.has_registry_record(name=["foo"])
+        with self.assertRaises(InvalidParameterError):
+            portal.has_registry_record("foo", interface=ImNotAnInterface)
+
+        registry = getUtility(IRegistry)
+        self.assertFalse(
+            portal.has_registry_record("field_one", interface=IMyRegistrySettings)
+        )
+        registry.registerInterface(IMyRegistrySettings)
+
+        self.assertTrue(
+            portal.has_registry_record("plone.app.querystring.field.path.title")
+        )
+        self.assertFalse(portal.has_registry_record("plone.app.querystring"))
+        self.assertTrue(
+            portal.has_registry_record("field_one", interface=IMyRegistrySettings)
+        )
+        self.assertFalse(
+            portal.has_registry_record("field_three", interface=IMyRegistrySettings)
+        )
+
     def test_get_registry_record_from_interface(self):
         """Test that getting a record from an interface works."""
         registry = getUtility(IRegistry)
@@ -645,6 +1128,210 @@ class TestPloneApiPortal(unittest.TestCase):
             2,
         )
 
+    def test_get_registry_records_constraints(self):
+        """Test the constraints for getting many registry records."""
+        from plone.api.exc import InvalidParameterError
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.get_registry_records()
+
+        with self.assertRaises(InvalidParameterError):
+            portal.get_registry_records(names=["foo"], prefix="foo")
+
+        with self.assertRaises(InvalidParameterError):
+            portal.get_registry_records(interface=ImNotAnInterface)
+
+        with self.assertRaises(InvalidParameterError):
+            portal.get_registry_records(names="plone.api.plone_power")
+
+    def test_get_registry_records(self):
+        """Test getting many registry records at once."""
+        from plone.api.exc import InvalidParameterError
+
+        registry = getUtility(IRegistry)
+        registry.registerInterface(IMyRegistrySettings)
+        registry["plone.api.tests.test_portal.IMyRegistrySettings.field_one"] = "one"
+        registry.records["plone.api.plone_power"] = Record(
+            field.TextLine(title="Plone's Power"),
+        )
+        registry["plone.api.plone_power"] = "awesome"
+
+        self.assertEqual(
+            portal.get_registry_records(interface=IMyRegistrySettings),
+            {"field_one": "one", "field_two": None},
+        )
+        self.assertEqual(
+            portal.get_registry_records(
+                names=[
+                    "plone.api.plone_power",
+                    "plone.api.tests.test_portal.IMyRegistrySettings.field_one",
+                ],
+            ),
+            {
+                "plone.api.plone_power": "awesome",
+                "plone.api.tests.test_portal.IMyRegistrySettings.field_one": "one",
+            },
+        )
+        self.assertEqual(
+            portal.get_registry_records(prefix="plone.api."),
+            {
+                "plone.api.plone_power": "awesome",
+                "plone.api.tests.test_portal.IMyRegistrySettings.field_one": "one",
+                "plone.api.tests.test_portal.IMyRegistrySettings.field_two": None,
+            },
+        )
+        self.assertEqual(portal.get_registry_records(prefix="plone.api.foo"), {})
+
+        with self.assertRaises(InvalidParameterError) as cm:
+            portal.get_registry_records(names=["plone.api.plone_power", "foo"])
+        self.assertEqual(str(cm.exception), "Cannot find records with names:\nfoo")
+        self.assertEqual(
+            portal.get_registry_records(
+                names=["plone.api.plone_power", "foo"],
+                default=None,
+            ),
+            {"plone.api.plone_power": "awesome", "foo": None},
+        )
+
+    def test_registry_record_cache(self):
+        """Test that registry records are cached with the lookup cache."""
+        registry = getUtility(IRegistry)
+        registry.registerInterface(IMyRegistrySettings)
+        registry.records["plone.api.plone_power"] = Record(
+            field.TextLine(title="Plone's Power"),
+        )
+        registry["plone.api.plone_power"] = "awesome"
+
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+
+        with mock.patch("plone.api.portal.getUtility", wraps=getUtility) as get_utility:
+            self.assertEqual(
+                portal.get_registry_record("plone.api.plone_power"), "awesome"
+            )
+            self.assertIsNone(
+                portal.get_registry_record("field_one", interface=IMyRegistrySettings)
+            )
+            self.assertEqual(
+                portal.get_registry_records(interface=IMyRegistrySettings),
+                {"field_one": None, "field_two": None},
+            )
+            self.assertEqual(get_utility.call_count, 1)
+
+        # Writes are seen, whether they go through plone.api or not
+        portal.set_registry_record("plone.api.plone_power", "mighty")
+        self.assertEqual(portal.get_registry_record("plone.api.plone_power"), "mighty")
+        registry["plone.api.tests.test_portal.IMyRegistrySettings.field_one"] = "one"
+        self.assertEqual(
+            portal.get_registry_record("field_one", interface=IMyRegistrySettings),
+            "one",
+        )
+        del registry.records["plone.api.plone_power"]
+        self.assertEqual(
+            portal.get_registry_record("plone.api.plone_power", default="gone"),
+            "gone",
+        )
+
+        # The values are cached per transaction
+        with mock.patch("plone.api.portal.transaction.get", return_value=object()):
+            with mock.patch(
+                "plone.api.portal.getUtility", wraps=getUtility
+            ) as get_utility:
+                portal.get_registry_record("field_one", interface=IMyRegistrySettings)
+                self.assertEqual(get_utility.call_count, 1)
+
+        # Disabling the cache also stops invalidating it
+        portal.enable_lookup_cache(False)
+        registry["plone.api.tests.test_portal.IMyRegistrySettings.field_two"] = "two"
+        self.assertEqual(
+            portal.get_registry_record("field_two", interface=IMyRegistrySettings),
+            "two",
+        )
+
+    def test_set_registry_records_constraints(self):
+        """Test the constraints for setting many registry records."""
+        from plone.api.exc import InvalidParameterError
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.set_registry_records()
+
+        with self.assertRaises(InvalidParameterError):
+            portal.set_registry_records(records=[("foo", "bar")])
+
+        with self.assertRaises(InvalidParameterError):
+            portal.set_registry_records(
+                records={"foo": "bar"},
+                interface=ImNotAnInterface,
+            )
+
+    def test_set_registry_records(self):
+        """Test setting many registry records at once."""
+        registry = getUtility(IRegistry)
+        registry.registerInterface(IMyRegistrySettings)
+        registry.records["plone.api.plone_power"] = Record(
+            field.TextLine(title="Plone's Power"),
+        )
+
+        events = []
+        gsm = getGlobalSiteManager()
+        gsm.registerHandler(events.append, (IRecordModifiedEvent,))
+        self.addCleanup(gsm.unregisterHandler, events.append, (IRecordModifiedEvent,))
+
+        portal.set_registry_records(
+            {
+                "plone.api.plone_power": "awesome",
+                "plone.api.tests.test_portal.IMyRegistrySettings.field_one": "one",
+            },
+        )
+        self.assertEqual(registry["plone.api.plone_power"], "awesome")
+        self.assertEqual(
+            registry["plone.api.tests.test_portal.IMyRegistrySettings.field_one"],
+            "one",
+        )
+        self.assertEqual(len(events), 2)
+
+        portal.set_registry_records(
+            {"field_one": "uno", "field_two": None},
+            interface=IMyRegistrySettings,
+        )
+        self.assertEqual(
+            portal.get_registry_records(interface=IMyRegistrySettings),
+            {"field_one": "uno", "field_two": None},
+        )
+        self.assertEqual(len(events), 4)
+
+    def test_set_registry_records_errors(self):
+        """Test that no record is set if any of them is invalid."""
+        from plone.api.exc import InvalidParameterError
+
+        registry = getUtility(IRegistry)
+        registry.registerInterface(IMyRegistrySettings)
+
+        with self.assertRaises(InvalidParameterError) as cm:
+            portal.set_registry_records(
+                {"field_one": "one", "field_two": 2, "field_three": "three"},
+                interface=IMyRegistrySettings,
+            )
+        self.assertEqual(
+            str(cm.exception),
+            "Cannot set the registry records:\n"
+            "field_two: Object is of wrong type.\n"
+            "field_three: Cannot find a record with this name",
+        )
+        self.assertIsNone(
+            portal.get_registry_record("field_one", interface=IMyRegistrySettings)
+        )
+
+        with self.assertRaises(InvalidParameterError) as cm:
+            portal.set_registry_records({"plone.api.foo": "foo"})
+        self.assertEqual(
+            str(cm.exception),
+            "Cannot set the registry records:\n"
+            "plone.api.foo: Cannot find a record with this name",
+        )
+
     def test_set_valid_registry_record(self):
         """Test that setting a valid registry record succeeds."""
         registry = getUtility(IRegistry)
@@ -860,6 +1547,79 @@ class TestPloneApiPortal(unittest.TestCase):
         self.layer["request"]["LANGUAGE"] = "fr"
         self.assertEqual(portal.get_current_language(), "fr")
 
+    def test_get_default_language_cache(self):
+        """The default language is cached with the registry records."""
+        registry = getUtility(IRegistry)
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+
+        registry_class = type(aq_base(registry))
+        getitem = registry_class.__getitem__
+        with mock.patch.object(
+            registry_class, "__getitem__", autospec=True, side_effect=getitem
+        ) as reads:
+            self.assertEqual(portal.get_default_language(), "en")
+            self.assertEqual(portal.get_current_language(), "en")
+            self.assertEqual(reads.call_count, 1)
+
+        # Changing the language settings is seen right away
+        portal.set_registry_record("plone.default_language", "de")
+        self.assertEqual(portal.get_default_language(), "de")
+
+    def test_get_current_languages(self):
+        """Test resolving the current language of many contexts."""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.get_current_languages()
+
+        folder = content.create(
+            container=self.portal,
+            type="Folder",
+            id="languages",
+        )
+        folder.language = "nl"
+        folder.reindexObject()
+        # No language was negotiated for the request yet
+        self.layer["request"].other.pop("LANGUAGE", None)
+        document = content.create(container=folder, type="Document", id="doc")
+        brains = content.find(UID=[folder.UID(), document.UID()], sort_on="id")
+        self.assertEqual(
+            [brain.getId for brain in brains],
+            ["doc", "languages"],
+        )
+
+        self.assertEqual(
+            portal.get_current_languages([folder, document, None]),
+            [
+                portal.get_current_language(folder),
+                portal.get_current_language(document),
+                portal.get_current_language(),
+            ],
+        )
+        self.assertEqual(
+            portal.get_current_languages([folder, document, None]),
+            ["nl", "en", "en"],
+        )
+        self.assertEqual(portal.get_current_languages(brains), ["en", "nl"])
+
+        # With a Language metadata column, brains are not woken up
+        catalog = portal.get_tool("portal_catalog")
+        catalog.addColumn("Language")
+        folder.reindexObject()
+        document.reindexObject()
+        brains = content.find(UID=[folder.UID(), document.UID()], sort_on="id")
+        with mock.patch.object(type(aq_base(brains[0])), "getObject") as get_object:
+            self.assertEqual(portal.get_current_languages(brains), ["en", "nl"])
+        get_object.assert_not_called()
+
+        # A negotiated language of the request wins, like in get_current_language
+        self.layer["request"]["LANGUAGE"] = "fr"
+        self.assertEqual(
+            portal.get_current_languages([folder, brains[0]]),
+            ["fr", "fr"],
+        )
+
     def test_translate(self):
         """Test translation."""
         self.assertEqual(
@@ -896,6 +1656,109 @@ class TestPloneApiPortal(unittest.TestCase):
             "Página",
         )
 
+    def test_translate_cache(self):
+        """Test that translations are cached with the lookup cache."""
+        from zope.i18nmessageid import MessageFactory
+
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+        translation_service = portal.get_tool("translation_service")
+        _ = MessageFactory("plone")
+
+        with mock.patch.object(
+            translation_service,
+            "utranslate",
+            wraps=translation_service.utranslate,
+        ) as utranslate:
+            self.assertEqual(portal.translate("Page", lang="pt-br"), "Página")
+            self.assertEqual(portal.translate("Page", lang="pt_BR"), "Página")
+            self.assertEqual(utranslate.call_count, 1)
+
+            # Messages are cached with their domain and mapping
+            self.assertEqual(
+                portal.translate(_("Page"), domain="plonelocales", lang="pt_BR"),
+                "Página",
+            )
+            message = _("${count} items", mapping={"count": 2})
+            self.assertEqual(portal.translate(message, lang="de"), "2 items")
+            message = _("${count} items", mapping={"count": 3})
+            self.assertEqual(portal.translate(message, lang="de"), "3 items")
+            self.assertEqual(portal.translate(message, lang="de"), "3 items")
+            self.assertEqual(utranslate.call_count, 4)
+
+            # The negotiated language depends on the request
+            portal.translate("Page")
+            portal.translate("Page")
+            self.assertEqual(utranslate.call_count, 6)
+
+            # The least recently used translations are dropped
+            with mock.patch("plone.api.portal.TRANSLATION_CACHE_SIZE", 1):
+                portal.translate("Page", lang="es")
+                portal.translate("Page", lang="pt_BR")
+            self.assertEqual(utranslate.call_count, 8)
+
+    def test_translate_cache_domains(self):
+        """Test that registering a translation domain invalidates the cache."""
+        from zope.i18n.interfaces import ITranslationDomain
+        from zope.i18n.simpletranslationdomain import SimpleTranslationDomain
+
+        portal.enable_lookup_cache()
+        self.addCleanup(portal.enable_lookup_cache, False)
+
+        self.assertEqual(
+            portal.translate("Page", domain="plone.api.tests", lang="es"), "Page"
+        )
+        domain = SimpleTranslationDomain("plone.api.tests", {("es", "Page"): "Página"})
+        gsm = getGlobalSiteManager()
+        gsm.registerUtility(domain, ITranslationDomain, name="plone.api.tests")
+        self.addCleanup(
+            gsm.unregisterUtility, domain, ITranslationDomain, name="plone.api.tests"
+        )
+        self.assertEqual(
+            portal.translate("Page", domain="plone.api.tests", lang="es"), "Página"
+        )
+
+    def test_translate_many(self):
+        """Test translating many messages at once."""
+        from plone.api.exc import InvalidParameterError
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            portal.translate_many()
+        with self.assertRaises(InvalidParameterError):
+            portal.translate_many("Page")
+
+        translation_service = portal.get_tool("translation_service")
+        with mock.patch.object(
+            translation_service,
+            "utranslate",
+            wraps=translation_service.utranslate,
+        ) as utranslate:
+            self.assertEqual(
+                portal.translate_many(["Page", "Edited", "Page"], lang="pt-br"),
+                ["Página", "Editado", "Página"],
+            )
+            self.assertEqual(utranslate.call_count, 2)
+        self.assertEqual(
+            portal.translate_many(["month_apr", "month_may"], "plonelocales", "fr"),
+            ["Avril", "Mai"],
+        )
+        self.assertEqual(portal.translate_many([]), [])
+
+    def test_translate_many_messages(self):
+        """Test that messages with the same text in other domains differ."""
+        from zope.i18nmessageid import MessageFactory
+
+        messages = [
+            MessageFactory("plonelocales")("month_jan"),
+            MessageFactory("plone")("month_jan"),
+            "month_jan",
+        ]
+        self.assertEqual(
+            portal.translate_many(messages, domain="plonelocales", lang="de"),
+            ["Januar", portal.translate(messages[1], lang="de"), "Januar"],
+        )
+
     def test_get_vocabulary(self):
         """Test getting a vocabulary by name."""
         from plone.api.exc import InvalidParameterError
@@ -944,6 +1807,70 @@ class TestPloneApiPortal(unittest.TestCase):
         for vocabulary_name in common_vocabularies:
             self.assertIn(vocabulary_name, names)
 
+    def test_vocabulary_cache(self):
+        """Test the opt-in cache of vocabularies."""
+        from plone.api.exc import InvalidParameterError
+
+        with self.assertRaises(InvalidParameterError):
+            portal.enable_vocabulary_cache(ttl=0)
+
+        name = "plone.app.vocabularies.PortalTypes"
+        self.assertIsNot(portal.get_vocabulary(name), portal.get_vocabulary(name))
+
+        portal.enable_vocabulary_cache(ttl=60)
+        self.addCleanup(portal.enable_vocabulary_cache, False)
+
+        vocabulary = portal.get_vocabulary(name)
+        self.assertIs(portal.get_vocabulary(name), vocabulary)
+        self.assertIs(portal.get_vocabulary(name, context=self.portal), vocabulary)
+
+        # The key includes the context and the user
+        folder = content.create(container=self.portal, type="Folder", id="folder")
+        folder_vocabulary = portal.get_vocabulary(name, context=folder)
+        self.assertIsNot(folder_vocabulary, vocabulary)
+        with env.adopt_user(username="admin"):
+            self.assertIsNot(portal.get_vocabulary(name), vocabulary)
+
+        # Content changes clear the cache
+        vocabulary = portal.get_vocabulary(name)
+        content.create(container=self.portal, type="Document", id="page")
+        self.assertIsNot(portal.get_vocabulary(name), vocabulary)
+
+        # Cached vocabularies expire
+        vocabulary = portal.get_vocabulary(name)
+        later = time.monotonic() + 61
+        with mock.patch("plone.api.portal.time.monotonic", return_value=later):
+            self.assertIsNot(portal.get_vocabulary(name), vocabulary)
+
+        # Vocabularies that look up their terms lazily are not cached
+        users = "plone.app.vocabularies.Users"
+        self.assertIsNot(portal.get_vocabulary(users), portal.get_vocabulary(users))
+
+        # Disabling the cache clears it
+        vocabulary = portal.get_vocabulary(name)
+        portal.enable_vocabulary_cache(False)
+        self.assertIsNot(portal.get_vocabulary(name), vocabulary)
+
+    def test_get_vocabulary_names_cache(self):
+        """Test that the vocabulary names are cached until factories change."""
+        from zope.schema.interfaces import IVocabularyFactory
+
+        names = portal.get_vocabulary_names()
+        names.append("foo")
+        with mock.patch("plone.api.portal.getUtilitiesFor") as get_utilities:
+            self.assertNotIn("foo", portal.get_vocabulary_names())
+            get_utilities.assert_not_called()
+
+        def factory(context):
+            return SimpleVocabulary([])
+
+        gsm = getGlobalSiteManager()
+        gsm.registerUtility(factory, IVocabularyFactory, name="plone.api.tests")
+        self.addCleanup(
+            gsm.unregisterUtility, factory, IVocabularyFactory, name="plone.api.tests"
+        )
+        self.assertIn("plone.api.tests", portal.get_vocabulary_names())
+
     def test_vocabulary_terms(self):
         """Test the actual content of retrieved vocabularies."""
         # Get portal types vocabulary
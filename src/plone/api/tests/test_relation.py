@@ -572,3 +572,57 @@ class TestPloneApiRelation(unittest.TestCase):
         self.assertEqual(
             len(api.relation.get(relationship="link", unrestricted=True)), 3
         )
+
+    def test_iter_breaches_constraints(self):
+        """Test the constraints when finding breaches."""
+        from plone.api.exc import MissingParameterError
+
+        with self.assertRaises(MissingParameterError):
+            api.relation.iter_breaches()
+
+        self.assertEqual(list(api.relation.iter_breaches(objects=[])), [])
+
+    def test_iter_breaches(self):
+        """Test finding relations that point into objects from outside."""
+        api.relation.create(source=self.blog, target=self.team, relationship="link")
+        api.relation.create(source=self.contact, target=self.team, relationship="link")
+        api.relation.create(source=self.team, target=self.about, relationship="link")
+        api.relation.create(
+            source=self.training, target=self.sprint, relationship="link"
+        )
+
+        def breaches(objects):
+            return [
+                (relation.from_object, relation.to_object)
+                for relation in api.relation.iter_breaches(objects=objects)
+            ]
+
+        # Fewer items to delete than relation targets
+        self.assertEqual(
+            sorted(breaches([self.team]), key=str),
+            sorted([(self.blog, self.team), (self.contact, self.team)], key=str),
+        )
+        self.assertEqual(
+            sorted(breaches([self.team, self.contact, self.sprint]), key=str),
+            sorted([(self.blog, self.team), (self.training, self.sprint)], key=str),
+        )
+
+        # More items to delete than relation targets
+        self.assertEqual(breaches([self.about]), [(self.blog, self.team)])
+        self.assertEqual(breaches([self.about, self.blog, self.events]), [])
+
+    def test_iter_breaches_ignores_broken_relations(self):
+        """Test that relations from deleted sources are no breaches."""
+        api.relation.create(source=self.blog, target=self.team, relationship="link")
+        api.content.delete(self.blog, check_linkintegrity=False)
+        self.assertEqual(list(api.relation.iter_breaches(objects=[self.team])), [])
+
+    def test_iter_breaches_ignores_broken_targets(self):
+        """Test that relations to deleted targets are no breaches."""
+        api.relation.create(source=self.blog, target=self.training, relationship="link")
+        api.content.delete(self.training, check_linkintegrity=False)
+        self.assertEqual(list(api.relation.iter_breaches(objects=[self.about])), [])
+
+        # Deleting unrelated content is not blocked by the broken relation
+        api.content.delete(self.about)
+        self.assertNotIn("about", self.portal)